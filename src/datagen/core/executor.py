@@ -11,7 +11,7 @@ from datagen.core.dag import build_dag
 from datagen.core.seed import SeedManager
 from datagen.core.generators.registry import GeneratorRegistry
 from datagen.core.generators.primitives import sample_fanout
-from datagen.core.modifiers import apply_modifiers
+from datagen.core.modifiers import add_effect_window_ns, apply_modifiers
 from datagen.core.vintage_utils import (
     calculate_entity_ages,
     apply_vintage_multipliers_to_fanout,
@@ -40,6 +40,9 @@ class DatasetExecutor:
         # Storage for generated data
         self.generated_data = {}
 
+        # Effect tables with precomputed window columns: {table: (source_df, effect_df)}
+        self._effect_tables = {}
+
     def execute(self, output_dir: Optional[Path] = None) -> dict[str, pd.DataFrame]:
         """
         Execute full dataset generation.
@@ -864,9 +867,7 @@ class DatasetExecutor:
         reference_time = pd.to_datetime(self.dataset.timeframe.end)
         entity_created_at = pd.to_datetime(parent_df[created_at_col])
 
-        entity_ages = calculate_entity_ages(
-            entity_created_at, pd.Series([reference_time] * len(parent_df)), time_unit=time_unit
-        )
+        entity_ages = calculate_entity_ages(entity_created_at, reference_time, time_unit=time_unit)
 
         # Apply vintage multipliers to fanout
         modified_fanout = apply_vintage_multipliers_to_fanout(
@@ -902,13 +903,29 @@ class DatasetExecutor:
                 effect_table_name = args.get("effect_table")
                 if effect_table_name and effect_table_name in self.generated_data:
                     # Add effect table as a column (each row gets the full table)
-                    effect_df = self.generated_data[effect_table_name]
+                    effect_df = self._effect_table(effect_table_name, args.get("window"))
                     context_df[f"_effect_{effect_table_name}"] = (
                         [effect_df] * len(context_df) if len(context_df) > 0 else []
                     )
 
         return context_df
 
+    def _effect_table(self, table_name: str, window: Optional[dict]) -> pd.DataFrame:
+        """
+        Get an effect table with its window bounds precomputed as int64 ns.
+
+        The augmented copy is cached per table so the conversion runs once,
+        however many effect modifiers reference it; generated_data itself is
+        left untouched so the extra columns never reach the output.
+        """
+        source = self.generated_data[table_name]
+        cached = self._effect_tables.get(table_name)
+        effect_df = cached[1] if cached is not None and cached[0] is source else source
+
+        effect_df = add_effect_window_ns(effect_df, window)
+        self._effect_tables[table_name] = (source, effect_df)
+        return effect_df
+
     def _cast_to_dtype(self, values: np.ndarray, dtype_str: str, nullable: bool) -> np.ndarray:
         """Cast values to target dtype."""
         if dtype_str == "int":
@@ -927,16 +944,21 @@ class DatasetExecutor:
 
     def write_output(self, output_dir: Path):
         """Write generated data to Parquet files."""
-        from datagen.core.output import write_parquet, write_metadata
+        from datagen.core.output import flush, write_parquet_async, write_metadata
 
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Writing {len(self.generated_data)} tables to {output_dir}")
 
+        # Tables are independent files, so encode and write them concurrently
+        writes = [
+            write_parquet_async(df, output_dir / f"{table_id}.parquet")
+            for table_id, df in self.generated_data.items()
+        ]
+        flush(writes)
+
         for table_id, df in self.generated_data.items():
-            parquet_path = output_dir / f"{table_id}.parquet"
-            write_parquet(df, parquet_path)
             logger.info(f"  Wrote {table_id}.parquet ({len(df)} rows)")
 
         # Write metadata
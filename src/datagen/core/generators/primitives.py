@@ -1,9 +1,11 @@
 """Primitive generators: sequence, choice, distribution, fanout."""
 
 import numpy as np
-from typing import Any, Optional
+from typing import Any, Optional, Union
 import logging
 
+from datagen.core.jit import HAS_NUMBA, njit
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,9 +39,9 @@ def generate_sequence(start: int, step: int, size: int) -> np.ndarray:
 # Choice Generator
 # ============================================================================
 
-def normalize_weights(weights: list[float]) -> np.ndarray:
+def normalize_weights(weights: Union[np.ndarray, list[float]]) -> np.ndarray:
     """Normalize weights to sum to 1.0."""
-    w = np.array(weights, dtype=float)
+    w = np.asarray(weights, dtype=np.float64)
     total = w.sum()
     if total == 0:
         raise ValueError("Weights sum to zero")
@@ -57,9 +59,11 @@ def generate_zipf_weights(n: int, alpha: float = 1.5) -> np.ndarray:
     Returns:
         Normalized weights following Zipf law
     """
-    ranks = np.arange(1, n + 1)
-    weights = 1.0 / (ranks ** alpha)
-    return normalize_weights(weights.tolist())
+    # Evaluate rank^-alpha in log space: exp/log vectorize better than pow and
+    # the rank-1 weight stays exactly 1.0, so the head never underflows.
+    log_ranks = np.log(np.arange(1, n + 1, dtype=np.float64))
+    weights = np.exp(-alpha * log_ranks)
+    return normalize_weights(weights)
 
 
 def generate_head_tail_weights(
@@ -96,7 +100,57 @@ def generate_head_tail_weights(
         tail_weights
     ])
 
-    return normalize_weights(weights.tolist())
+    return normalize_weights(weights)
+
+
+class AliasSampler:
+    """
+    Weighted index sampler using Vose's alias method.
+
+    Building the table is O(n) and done once; each draw then costs two
+    uniform deviates and a table lookup, independent of n. Use this when
+    the same weights are sampled repeatedly.
+
+    Examples:
+        >>> sampler = AliasSampler([0.5, 0.3, 0.2])
+        >>> rng = np.random.default_rng(42)
+        >>> indices = sampler.sample(5, rng)
+        >>> len(indices)
+        5
+    """
+
+    def __init__(self, weights):
+        p = normalize_weights(weights)
+        n = len(p)
+        scaled = p * n
+
+        prob = np.ones(n, dtype=float)
+        alias = np.arange(n, dtype=np.int64)
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+
+        while small and large:
+            lo = small.pop()
+            hi = large.pop()
+            prob[lo] = scaled[lo]
+            alias[lo] = hi
+            scaled[hi] = scaled[hi] + scaled[lo] - 1.0
+            if scaled[hi] < 1.0:
+                small.append(hi)
+            else:
+                large.append(hi)
+
+        # Leftovers are exactly 1.0 up to rounding error
+        self.n = n
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """Draw `size` indices in [0, n) following the sampler's weights."""
+        i = rng.integers(0, self.n, size)
+        u = rng.random(size)
+        return np.where(u < self.prob[i], i, self.alias[i])
 
 
 def generate_choice(
@@ -131,28 +185,51 @@ def generate_choice(
     if n == 0:
         raise ValueError("choices cannot be empty")
 
-    # Determine weights
+    w = resolve_choice_weights(n, weights, weights_kind)
+
+    # Sample
+    indices = rng.choice(n, size=size, p=w)
+    return np.array([choices[i] for i in indices])
+
+
+def resolve_choice_weights(
+    n: int,
+    weights: Optional[list[float]] = None,
+    weights_kind: Optional[str] = None
+) -> Optional[np.ndarray]:
+    """
+    Resolve explicit weights or a weights_kind spec into sampling probabilities.
+
+    Args:
+        n: Number of choices
+        weights: Optional explicit weights
+        weights_kind: Optional weight distribution ("uniform", "zipf@alpha", "head_tail@params")
+
+    Returns:
+        Normalized probabilities, or None for uniform sampling
+
+    Raises:
+        ValueError: If explicit weights do not have one entry per choice
+    """
     if weights is not None:
-        w = normalize_weights(weights)
+        if len(weights) != n:
+            raise ValueError(f"weights has {len(weights)} entries but there are {n} choices")
+        return normalize_weights(weights)
     elif weights_kind == "uniform" or weights_kind is None:
-        w = None  # numpy handles uniform by default
+        return None  # numpy handles uniform by default
     elif weights_kind.startswith("zipf@"):
         alpha = float(weights_kind.split("@")[1])
-        w = generate_zipf_weights(n, alpha)
+        return generate_zipf_weights(n, alpha)
     elif weights_kind.startswith("head_tail@"):
         # Parse head_tail@{head_share,tail_alpha}
         params = weights_kind.split("@")[1].strip("{}")
         parts = params.split(",")
         head_share = float(parts[0]) if len(parts) > 0 else 0.8
         tail_alpha = float(parts[1]) if len(parts) > 1 else 1.5
-        w = generate_head_tail_weights(n, head_share, tail_alpha)
+        return generate_head_tail_weights(n, head_share, tail_alpha)
     else:
         logger.warning(f"Unknown weights_kind: {weights_kind}, using uniform")
-        w = None
-
-    # Sample
-    indices = rng.choice(n, size=size, p=w)
-    return np.array([choices[i] for i in indices])
+        return None
 
 
 # ============================================================================
@@ -161,9 +238,24 @@ def generate_choice(
 
 def clamp_values(values: np.ndarray, clamp: tuple[float, float]) -> np.ndarray:
     """Clamp values to [min, max] range."""
+    if HAS_NUMBA and values.dtype == np.float64 and values.ndim == 1:
+        return _clip_nb(np.ascontiguousarray(values), float(clamp[0]), float(clamp[1]))
     return np.clip(values, clamp[0], clamp[1])
 
 
+@njit(cache=True)
+def _clip_nb(values, lo, hi):
+    out = np.empty_like(values)
+    for i in range(values.shape[0]):
+        v = values[i]
+        if v < lo:
+            v = lo
+        elif v > hi:
+            v = hi
+        out[i] = v
+    return out
+
+
 def generate_distribution(
     dist_type: str,
     params: dict,
@@ -260,10 +352,8 @@ def sample_fanout(
     else:
         raise ValueError(f"Unknown fanout distribution: {distribution}")
 
-    # Apply bounds
-    if min_val is not None:
-        counts = np.maximum(counts, min_val)
-    if max_val is not None:
-        counts = np.minimum(counts, max_val)
+    # Apply bounds in a single in-place pass
+    if min_val is not None or max_val is not None:
+        np.clip(counts, min_val, max_val, out=counts)
 
-    return counts.astype(int)
+    return counts.astype(np.int64, copy=False)
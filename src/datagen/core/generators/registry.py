@@ -4,10 +4,12 @@ import numpy as np
 import pandas as pd
 from typing import Any, Optional, Dict
 import logging
+from collections import OrderedDict
 
 from datagen.core.generators.primitives import (
     generate_sequence,
-    generate_choice,
+    resolve_choice_weights,
+    AliasSampler,
     generate_distribution,
     sample_fanout,
 )
@@ -26,12 +28,26 @@ class LookupResolver:
 
     def __init__(self):
         self._data_cache: Dict[str, pd.DataFrame] = {}
+        # Column arrays extracted on first lookup, keyed by (table_id, column)
+        self._column_cache: Dict[tuple[str, str], np.ndarray] = {}
 
     def register_table(self, table_id: str, df: pd.DataFrame):
         """Register a generated table for lookups."""
         self._data_cache[table_id] = df.copy()
+        # Drop arrays from any previous (e.g. partial self-reference) registration
+        for key in [k for k in self._column_cache if k[0] == table_id]:
+            del self._column_cache[key]
         logger.debug(f"Registered table '{table_id}' with {len(df)} rows")
 
+    def _column_values(self, table_id: str, column: str) -> np.ndarray:
+        """Get a registered column as a NumPy array, extracting it once."""
+        key = (table_id, column)
+        values = self._column_cache.get(key)
+        if values is None:
+            values = self._data_cache[table_id][column].to_numpy(copy=False)
+            self._column_cache[key] = values
+        return values
+
     def lookup(
         self,
         from_ref: str,
@@ -82,7 +98,7 @@ class LookupResolver:
 
         # If no join condition, randomly sample
         if on is None or parent_data is None:
-            values = source_df[column].values
+            values = self._column_values(table_id, column)
             indices = rng.choice(len(values), size=size, replace=True)
             return values[indices]
 
@@ -151,6 +167,24 @@ def generate_expression(code: str, context: pd.DataFrame) -> np.ndarray:
 # Generator Registry
 # ============================================================================
 
+GENERATOR_TYPES = frozenset({
+    "sequence", "choice", "distribution", "datetime_series",
+    "faker", "lookup", "expression", "enum_list"
+})
+
+
+# Prepared choice specs kept per registry (least recently used evicted first)
+_CHOICE_CACHE_SIZE = 256
+
+# (spec, snapshot of its fields, choices array, sampler or None for uniform)
+_PreparedChoice = tuple[dict, tuple, np.ndarray, Optional[AliasSampler]]
+
+
+def _choice_fields(spec: dict) -> tuple:
+    """Fields of a choice spec that determine its prepared choices and sampler."""
+    return spec.get("choices"), spec.get("weights"), spec.get("weights_kind")
+
+
 class GeneratorRegistry:
     """
     Central registry mapping generator specs to functions.
@@ -160,6 +194,10 @@ class GeneratorRegistry:
 
     def __init__(self, lookup_resolver: Optional[LookupResolver] = None):
         self.lookup_resolver = lookup_resolver or LookupResolver()
+        # Prepared choice specs keyed by id(spec). Holding the spec keeps its id
+        # from being recycled while cached, and the snapshot of its fields
+        # catches specs mutated in place.
+        self._choice_cache: OrderedDict[int, _PreparedChoice] = OrderedDict()
 
     def generate(
         self,
@@ -217,14 +255,16 @@ class GeneratorRegistry:
 
     def _get_generator_type(self, spec: dict) -> str:
         """Extract generator type from spec."""
-        valid_types = {
-            "sequence", "choice", "distribution", "datetime_series",
-            "faker", "lookup", "expression", "enum_list"
-        }
-        gen_types = set(spec.keys()) & valid_types
-        if len(gen_types) != 1:
-            raise ValueError(f"Spec must have exactly one generator type, found: {gen_types}")
-        return list(gen_types)[0]
+        gen_type = None
+        for key in spec:
+            if key in GENERATOR_TYPES:
+                if gen_type is not None:
+                    found = {k for k in spec if k in GENERATOR_TYPES}
+                    raise ValueError(f"Spec must have exactly one generator type, found: {found}")
+                gen_type = key
+        if gen_type is None:
+            raise ValueError(f"Spec must have exactly one generator type, found: {set()}")
+        return gen_type
 
     def _gen_sequence(self, spec: dict, size: int) -> np.ndarray:
         start = spec.get("start", 1)
@@ -232,15 +272,37 @@ class GeneratorRegistry:
         return generate_sequence(start, step, size)
 
     def _gen_choice(self, spec: dict, size: int, rng: np.random.Generator) -> np.ndarray:
-        choices = spec.get("choices")
-        weights = spec.get("weights")
-        weights_kind = spec.get("weights_kind")
-
         # Handle choices_ref (will be resolved by executor)
         if "choices_ref" in spec:
             raise ValueError("choices_ref must be resolved before generation")
 
-        return generate_choice(choices, size, rng, weights, weights_kind)
+        cached = self._choice_cache.get(id(spec))
+        if cached is not None and cached[0] is spec and cached[1] == _choice_fields(spec):
+            self._choice_cache.move_to_end(id(spec))
+        else:
+            cached = self._prepare_choice(spec)
+            self._choice_cache.pop(id(spec), None)
+            self._choice_cache[id(spec)] = cached
+            if len(self._choice_cache) > _CHOICE_CACHE_SIZE:
+                self._choice_cache.popitem(last=False)
+
+        _, _, choices_arr, sampler = cached
+        if sampler is None:
+            indices = rng.choice(len(choices_arr), size=size)
+        else:
+            indices = sampler.sample(size, rng)
+        return choices_arr[indices]
+
+    def _prepare_choice(self, spec: dict) -> _PreparedChoice:
+        """Materialize choices and build the weighted sampler once per choice spec."""
+        choices = spec.get("choices")
+        if not choices:
+            raise ValueError("choices cannot be empty")
+
+        w = resolve_choice_weights(len(choices), spec.get("weights"), spec.get("weights_kind"))
+        sampler = AliasSampler(w) if w is not None else None
+        snapshot = tuple(list(f) if isinstance(f, list) else f for f in _choice_fields(spec))
+        return spec, snapshot, np.array(choices), sampler
 
     def _gen_distribution(self, spec: dict, size: int, rng: np.random.Generator) -> np.ndarray:
         dist_type = spec["type"]
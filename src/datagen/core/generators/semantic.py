@@ -41,6 +41,16 @@ DEFAULT_LOCALE_MAP = {
 }
 
 
+# Output dtypes for Faker methods with bounded-width results (default arguments only).
+# These are written straight into a preallocated array instead of going through a list.
+FAKER_DTYPE_HINTS = {
+    "ipv4": "<U15",
+    "country_code": "<U2",
+    "uuid4": "<U36",
+    "boolean": np.bool_,
+}
+
+
 def resolve_locale(country_or_city: str) -> str:
     """
     Resolve country/city code to Faker locale.
@@ -127,6 +137,14 @@ class FakerAdapter:
 
         # Generate values
         func = getattr(faker, method)
+
+        dtype = FAKER_DTYPE_HINTS.get(method)
+        if dtype is not None and not kwargs:
+            out = np.empty(size, dtype=dtype)
+            for i in range(size):
+                out[i] = func()
+            return out
+
         values = [func(**kwargs) for _ in range(size)]
 
         return np.array(values)
@@ -177,12 +195,20 @@ def generate_faker(
                 f"must match size ({size})"
             )
 
-        result = []
-        for country in locale_from_values:
-            loc = resolve_locale(str(country))
-            # Generate one value for this locale
-            val = _faker_adapter.generate(method, 1, rng, locale=loc, **kwargs)[0]
-            result.append(val)
+        # Resolve each distinct country/city once, then group rows by locale
+        unique_values, inverse = np.unique(
+            np.asarray(locale_from_values).astype(str), return_inverse=True
+        )
+        value_locales = np.array([resolve_locale(v) for v in unique_values])
+        row_locales = value_locales[inverse]
+
+        # One seeded batch per locale instead of re-seeding Faker for every row
+        result = [None] * size
+        for loc in np.unique(row_locales):
+            positions = np.flatnonzero(row_locales == loc)
+            batch = _faker_adapter.generate(method, len(positions), rng, locale=str(loc), **kwargs)
+            for pos, val in zip(positions, batch):
+                result[pos] = val
 
         return np.array(result)
 
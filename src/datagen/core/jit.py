@@ -0,0 +1,25 @@
+"""Optional Numba JIT support for hot numeric kernels.
+
+Numba is an optional dependency (``pip install -e ".[fast]"``). When it is not
+installed, ``njit`` is a no-op decorator and ``HAS_NUMBA`` is False; callers
+should check ``HAS_NUMBA`` and fall back to their NumPy implementation rather
+than running the loop-style kernels in pure Python.
+"""
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -6,6 +6,7 @@ from typing import Any, Optional
 import logging
 
 from datagen.core.generators.temporal import get_seasonality_multiplier
+from datagen.core.jit import HAS_NUMBA, njit, prange
 
 logger = logging.getLogger(__name__)
 
@@ -30,109 +31,259 @@ def apply_modifiers(
     """
     result = values.copy()
 
-    for modifier in modifiers:
-        # Handle both Pydantic models and dicts
-        if hasattr(modifier, 'transform'):
-            transform = modifier.transform
-            args = modifier.args
-        else:
-            transform = modifier["transform"]
-            args = modifier["args"]
+    # Handle both Pydantic models and dicts
+    specs = [
+        (m.transform, m.args) if hasattr(m, 'transform') else (m["transform"], m["args"])
+        for m in modifiers
+    ]
 
-        if transform == "multiply":
-            result = modify_multiply(result, args["factor"])
+    # Resolve the context's timestamp column once for modifiers that need it
+    timestamp_col = None
+    if context is not None and any(t in _TIMESTAMP_TRANSFORMS for t, _ in specs):
+        timestamp_col = _find_timestamp_column(context)
+
+    # One float64 buffer reused for every jitter/outlier draw in the chain
+    scratch = None
+    if any(t in _SCRATCH_TRANSFORMS for t, _ in specs):
+        scratch = np.empty(len(result), dtype=np.float64)
+
+    i = 0
+    while i < len(specs):
+        transform, args = specs[i]
+        i += 1
+
+        # Run consecutive arithmetic modifiers as one fused pass when Numba is available
+        if HAS_NUMBA and transform in _FUSABLE_TRANSFORMS and result.dtype == np.float64:
+            run_end = i
+            while run_end < len(specs) and specs[run_end][0] in _FUSABLE_TRANSFORMS:
+                run_end += 1
+            if run_end > i:  # at least two modifiers in the run
+                result = _apply_fused_arithmetic(result, specs[i - 1:run_end], rng)
+                i = run_end
+                continue
+
+        handler = _MODIFIER_HANDLERS.get(transform)
+        if handler is None:
+            logger.warning(f"Unknown modifier: {transform}, skipping")
+            continue
+
+        result = handler(result, args, rng, context, timestamp_col, scratch)
+
+    return result
+
+
+# ============================================================================
+# Modifier Dispatch
+# ============================================================================
+# Each handler takes (values, args, rng, context, timestamp_col, scratch) and
+# returns the new values. timestamp_col is the context's first datetime column,
+# resolved once per apply_modifiers call for the transforms in
+# _TIMESTAMP_TRANSFORMS; scratch is a float64 buffer of len(values) shared by the
+# random draws of the transforms in _SCRATCH_TRANSFORMS (None otherwise).
+
+_TIMESTAMP_TRANSFORMS = frozenset({"seasonality", "effect"})
+_SCRATCH_TRANSFORMS = frozenset({"jitter", "outliers"})
+
+
+def _find_timestamp_column(context: pd.DataFrame) -> Optional[str]:
+    """Find the first datetime column in context, ignoring embedded effect tables."""
+    for col, dtype in context.dtypes.items():
+        if str(col).startswith("_effect_"):
+            continue
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return col
+    return None
+
+
+def _handle_multiply(values, args, rng, context, timestamp_col, scratch):
+    return _multiply_inplace(values, args["factor"])
+
+
+def _handle_add(values, args, rng, context, timestamp_col, scratch):
+    return _add_inplace(values, args["value"])
+
+
+def _handle_clamp(values, args, rng, context, timestamp_col, scratch):
+    return _clamp_inplace(values, args["min"], args["max"])
 
-        elif transform == "add":
-            result = modify_add(result, args["value"])
 
+def _handle_jitter(values, args, rng, context, timestamp_col, scratch):
+    return _jitter_inplace(values, rng, args["std"], args.get("mode", "add"), scratch)
+
+
+def _handle_map_values(values, args, rng, context, timestamp_col, scratch):
+    return modify_map_values(values, args["mapping"])
+
+
+def _handle_seasonality(values, args, rng, context, timestamp_col, scratch):
+    # For seasonality on datetime columns, use the values being modified as timestamps
+    # For seasonality on numeric columns, need a timestamp column in context
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # Modifying a datetime column - this is selecting timestamps
+        # Seasonality doesn't make sense here, should be used on numeric values
+        logger.warning("Seasonality modifier on datetime column doesn't make sense, skipping")
+        return values
+    if context is None:
+        logger.warning("Seasonality modifier requires context, skipping")
+        return values
+
+    if timestamp_col is None:
+        logger.warning("Seasonality modifier requires datetime column in context, skipping")
+        return values
+
+    return modify_seasonality(values, context[timestamp_col], args["dimension"], args["weights"])
+
+
+def _handle_time_jitter(values, args, rng, context, timestamp_col, scratch):
+    return modify_time_jitter(values, rng, args["std_minutes"])
+
+
+def _handle_effect(values, args, rng, context, timestamp_col, scratch):
+    # Effects require external table data
+    if context is None:
+        logger.warning("Effect modifier requires context, skipping")
+        return values
+
+    # Get effect table from context (passed by executor)
+    effect_table_name = args.get("effect_table")
+    if f"_effect_{effect_table_name}" not in context.columns:
+        logger.warning(f"Effect table {effect_table_name} not in context, skipping")
+        return values
+
+    return modify_effect(
+        values,
+        context,
+        args["effect_table"],
+        args["on"],
+        args["window"],
+        args["map"],
+        timestamp_col=timestamp_col
+    )
+
+
+def _handle_outliers(values, args, rng, context, timestamp_col, scratch):
+    return modify_outliers(
+        values,
+        rng,
+        args["rate"],
+        args["mode"],
+        args.get("magnitude_dist", {"type": "lognormal", "params": {"mean": 0, "sigma": 0.5}}),
+        scratch=scratch
+    )
+
+
+def _handle_trend(values, args, rng, context, timestamp_col, scratch):
+    if context is None:
+        logger.warning("Trend modifier requires context, skipping")
+        return values
+
+    # Get timestamp column reference
+    time_col = args.get("time_reference")
+    if time_col not in context.columns:
+        logger.warning(f"Trend modifier time_reference '{time_col}' not found in context, skipping")
+        return values
+
+    return modify_trend(
+        values,
+        context[time_col],
+        args["type"],
+        args.get("growth_rate"),
+        args.get("params", {})
+    )
+
+
+_MODIFIER_HANDLERS = {
+    "multiply": _handle_multiply,
+    "add": _handle_add,
+    "clamp": _handle_clamp,
+    "jitter": _handle_jitter,
+    "map_values": _handle_map_values,
+    "seasonality": _handle_seasonality,
+    "time_jitter": _handle_time_jitter,
+    "effect": _handle_effect,
+    "outliers": _handle_outliers,
+    "trend": _handle_trend,
+}
+
+
+# ============================================================================
+# Fused Arithmetic Modifiers
+# ============================================================================
+
+_FUSABLE_TRANSFORMS = frozenset({"multiply", "add", "clamp", "jitter"})
+
+_OP_MUL = 0
+_OP_ADD = 1
+_OP_CLAMP = 2
+_OP_JITTER_ADD = 3
+_OP_JITTER_MUL = 4
+
+
+def _apply_fused_arithmetic(
+    values: np.ndarray,
+    specs: list[tuple[str, dict]],
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Apply a run of multiply/add/clamp/jitter modifiers in a single pass.
+
+    Jitter noise is drawn up front in modifier order, so the RNG stream and
+    the results match applying the modifiers one by one.
+    """
+    n_ops = len(specs)
+    ops = np.empty(n_ops, dtype=np.int64)
+    params = np.zeros((n_ops, 2), dtype=np.float64)
+    noise_rows = []
+
+    for k, (transform, args) in enumerate(specs):
+        if transform == "multiply":
+            ops[k] = _OP_MUL
+            params[k, 0] = args["factor"]
+        elif transform == "add":
+            ops[k] = _OP_ADD
+            params[k, 0] = args["value"]
         elif transform == "clamp":
-            result = modify_clamp(result, args["min"], args["max"])
-
-        elif transform == "jitter":
-            result = modify_jitter(result, rng, args["std"], args.get("mode", "add"))
-
-        elif transform == "map_values":
-            result = modify_map_values(result, args["mapping"])
-
-        elif transform == "seasonality":
-            # For seasonality on datetime columns, use the values being modified as timestamps
-            # For seasonality on numeric columns, need a timestamp column in context
-            if pd.api.types.is_datetime64_any_dtype(result):
-                # Modifying a datetime column - this is selecting timestamps
-                # Seasonality doesn't make sense here, should be used on numeric values
-                logger.warning("Seasonality modifier on datetime column doesn't make sense, skipping")
-            elif context is None:
-                logger.warning("Seasonality modifier requires context, skipping")
-            else:
-                # Find timestamp column in context to get seasonality multipliers
-                timestamp_col = None
-                for col in context.columns:
-                    if pd.api.types.is_datetime64_any_dtype(context[col]):
-                        timestamp_col = col
-                        break
-
-                if timestamp_col is None:
-                    logger.warning("Seasonality modifier requires datetime column in context, skipping")
-                else:
-                    result = modify_seasonality(
-                        result,
-                        context[timestamp_col],
-                        args["dimension"],
-                        args["weights"]
-                    )
-
-        elif transform == "time_jitter":
-            result = modify_time_jitter(result, rng, args["std_minutes"])
-
-        elif transform == "effect":
-            # Effects require external table data
-            if context is None:
-                logger.warning("Effect modifier requires context, skipping")
+            ops[k] = _OP_CLAMP
+            params[k, 0] = -np.inf if args["min"] is None else args["min"]
+            params[k, 1] = np.inf if args["max"] is None else args["max"]
+        else:
+            mode = args.get("mode", "add")
+            noise = rng.normal(0, args["std"], size=len(values))
+            if mode == "add":
+                ops[k] = _OP_JITTER_ADD
+            elif mode == "mul":
+                ops[k] = _OP_JITTER_MUL
             else:
-                # Get effect table from context (passed by executor)
-                effect_table_name = args.get("effect_table")
-                if f"_effect_{effect_table_name}" not in context.columns:
-                    logger.warning(f"Effect table {effect_table_name} not in context, skipping")
-                else:
-                    result = modify_effect(
-                        result,
-                        context,
-                        args["effect_table"],
-                        args["on"],
-                        args["window"],
-                        args["map"]
-                    )
-
-        elif transform == "outliers":
-            result = modify_outliers(
-                result,
-                rng,
-                args["rate"],
-                args["mode"],
-                args.get("magnitude_dist", {"type": "lognormal", "params": {"mean": 0, "sigma": 0.5}})
-            )
-
-        elif transform == "trend":
-            if context is None:
-                logger.warning("Trend modifier requires context, skipping")
+                raise ValueError(f"Unknown jitter mode: {mode}")
+            params[k, 0] = len(noise_rows)
+            noise_rows.append(noise)
+
+    noise = np.stack(noise_rows) if noise_rows else np.empty((0, len(values)))
+    out = np.empty_like(values)
+    _fused_arithmetic_kernel(np.ascontiguousarray(values), ops, params, noise, out)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _fused_arithmetic_kernel(values, ops, params, noise, out):
+    for i in prange(values.shape[0]):
+        v = values[i]
+        for k in range(ops.shape[0]):
+            op = ops[k]
+            if op == 0:
+                v = v * params[k, 0]
+            elif op == 1:
+                v = v + params[k, 0]
+            elif op == 2:
+                if v < params[k, 0]:
+                    v = params[k, 0]
+                elif v > params[k, 1]:
+                    v = params[k, 1]
+            elif op == 3:
+                v = v + noise[int(params[k, 0]), i]
             else:
-                # Get timestamp column reference
-                time_col = args.get("time_reference")
-                if time_col not in context.columns:
-                    logger.warning(f"Trend modifier time_reference '{time_col}' not found in context, skipping")
-                else:
-                    result = modify_trend(
-                        result,
-                        context[time_col],
-                        args["type"],
-                        args.get("growth_rate"),
-                        args.get("params", {})
-                    )
-
-        else:
-            logger.warning(f"Unknown modifier: {transform}, skipping")
-
-    return result
+                v = v * (1.0 + noise[int(params[k, 0]), i])
+        out[i] = v
 
 
 # ============================================================================
@@ -154,6 +305,64 @@ def modify_clamp(values: np.ndarray, min_val: float, max_val: float) -> np.ndarr
     return np.clip(values, min_val, max_val)
 
 
+# In-place variants used by apply_modifiers, which owns its working copy.
+# They fall back to the allocating versions when the result dtype would change
+# (e.g. an int column multiplied by a float factor).
+
+def _can_update_inplace(values: np.ndarray, *operands) -> bool:
+    return (
+        isinstance(values, np.ndarray)
+        and values.dtype.kind in "iuf"
+        and np.result_type(values, *operands) == values.dtype
+    )
+
+
+def _multiply_inplace(values: np.ndarray, factor: float) -> np.ndarray:
+    if not _can_update_inplace(values, factor):
+        return modify_multiply(values, factor)
+    return np.multiply(values, factor, out=values)
+
+
+def _add_inplace(values: np.ndarray, value: float) -> np.ndarray:
+    if not _can_update_inplace(values, value):
+        return modify_add(values, value)
+    return np.add(values, value, out=values)
+
+
+def _clamp_inplace(values: np.ndarray, min_val: float, max_val: float) -> np.ndarray:
+    bounds = [b for b in (min_val, max_val) if b is not None]
+    if not _can_update_inplace(values, *bounds):
+        return modify_clamp(values, min_val, max_val)
+    return np.clip(values, min_val, max_val, out=values)
+
+
+def _jitter_inplace(
+    values: np.ndarray,
+    rng: np.random.Generator,
+    std: float,
+    mode: str = "add",
+    scratch: Optional[np.ndarray] = None
+) -> np.ndarray:
+    if not (isinstance(values, np.ndarray) and values.dtype == np.float64):
+        return modify_jitter(values, rng, std, mode)
+
+    if scratch is not None:
+        # Same draws as rng.normal(0, std), written into the reused buffer
+        noise = rng.standard_normal(out=scratch)
+        noise *= std
+    else:
+        noise = rng.normal(0, std, size=len(values))
+
+    if mode == "add":
+        values += noise
+    elif mode == "mul":
+        noise += 1.0
+        values *= noise
+    else:
+        raise ValueError(f"Unknown jitter mode: {mode}")
+    return values
+
+
 # ============================================================================
 # Noise Modifiers
 # ============================================================================
@@ -202,14 +411,20 @@ def modify_time_jitter(
     Returns:
         Jittered timestamps
     """
-    timestamps = pd.to_datetime(timestamps)
-
-    # Generate jitter in minutes
+    # Generate jitter in minutes, then as integer nanoseconds
     jitter_minutes = rng.normal(0, std_minutes, size=len(timestamps))
+    jitter_ns = (jitter_minutes * 60e9).astype(np.int64)
+
+    if isinstance(timestamps, np.ndarray) and timestamps.dtype.kind == "M":
+        # Plain datetime64 array: add on the int64 view, leaving NaT untouched,
+        # and return a DatetimeIndex as pd.to_datetime would
+        ts_ns = timestamps.astype("datetime64[ns]", copy=False).view(np.int64)
+        jittered = np.where(ts_ns == np.iinfo(np.int64).min, ts_ns, ts_ns + jitter_ns)
+        return pd.DatetimeIndex(jittered.view("datetime64[ns]"))
 
-    # Convert to timedelta and add
-    jitter_td = pd.to_timedelta(jitter_minutes, unit='m')
-    return timestamps + jitter_td
+    # Series/Index/object input (possibly tz-aware): let pandas keep the container
+    timestamps = pd.to_datetime(timestamps)
+    return timestamps + pd.to_timedelta(jitter_ns, unit="ns")
 
 
 # ============================================================================
@@ -227,18 +442,48 @@ def modify_map_values(values: np.ndarray, mapping: dict) -> np.ndarray:
     Returns:
         Mapped values
     """
-    result = values.copy()
-
-    for old_val, new_val in mapping.items():
-        result[result == old_val] = new_val
-
-    return result
+    if not mapping:
+        return values.copy()
+
+    keys = np.array(list(mapping.keys()))
+    new_vals = np.array(list(mapping.values()))
+
+    if values.dtype.kind in "biuf" and keys.dtype.kind in "biuf" and new_vals.dtype.kind in "biuf":
+        # Numeric: binary-search each value among the sorted keys
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        idx = np.searchsorted(sorted_keys, values).clip(0, len(sorted_keys) - 1)
+        hit = sorted_keys[idx] == values
+
+        # Keep the input dtype, as assigning into a copy did (float mappings
+        # on an int column are truncated)
+        result = values.copy()
+        result[hit] = new_vals[order][idx[hit]]
+        return result
+
+    # Generic: one hash lookup per value, unmapped values pass through. The
+    # mapped values stay Python objects so numbers are not promoted to float
+    positions = pd.Index(list(mapping.keys())).get_indexer(values)
+    hit = positions >= 0
+    mapped = values.astype(object)
+    mapped[hit] = np.array(list(mapping.values()), dtype=object)[positions[hit]]
+
+    # String input stays a string array (at the width of the longest result)
+    if values.dtype.kind == "U":
+        return mapped.astype(str)
+    return mapped
 
 
 # ============================================================================
 # Temporal Modifiers
 # ============================================================================
 
+_NS_TO_YEARS = 1.0 / (365.25 * 86400 * 1e9)
+
+# Seasonality dimension -> (kernel code, expected number of weights)
+_SEASONALITY_DIMENSIONS = {"hour": (0, 24), "dow": (1, 7), "month": (2, 12)}
+
+
 def modify_seasonality(
     values: np.ndarray,
     timestamps: pd.Series,
@@ -257,10 +502,59 @@ def modify_seasonality(
     Returns:
         Scaled values
     """
+    if HAS_NUMBA and dimension in _SEASONALITY_DIMENSIONS and _is_real_array(values):
+        dim_code, expected_len = _SEASONALITY_DIMENSIONS[dimension]
+        ts = np.asarray(timestamps)
+        # tz-aware timestamps (object arrays), NaT and bad weights take the pandas path
+        if ts.dtype.kind == "M" and len(weights) == expected_len:
+            ts_ns = ts.astype("datetime64[ns]").view(np.int64)
+            if not (ts_ns == np.iinfo(np.int64).min).any():
+                return _seasonality_kernel(
+                    ts_ns,
+                    values.astype(np.float64, copy=False),
+                    np.asarray(weights, dtype=np.float64),
+                    dim_code,
+                )
+
     multipliers = get_seasonality_multiplier(timestamps, dimension, weights)
     return values * multipliers
 
 
+def _is_real_array(values) -> bool:
+    """Check whether values is an integer or float ndarray."""
+    return isinstance(values, np.ndarray) and values.dtype.kind in "iuf"
+
+
+@njit(parallel=True, cache=True)
+def _seasonality_kernel(ts_ns, values, weights, dim_code):
+    n = ts_ns.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        if dim_code == 0:
+            component = (ts_ns[i] // 3_600_000_000_000) % 24
+        else:
+            days = ts_ns[i] // 86_400_000_000_000
+            if dim_code == 1:
+                # 1970-01-01 was a Thursday (Monday=0)
+                component = (days + 3) % 7
+            else:
+                # Civil month from days since epoch (Hinnant's algorithm)
+                z = days + 719468
+                era = z // 146097
+                doe = z - era * 146097
+                yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+                doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+                mp = (5 * doy + 2) // 153
+                component = mp + 2 if mp < 10 else mp - 10
+        out[i] = values[i] * weights[component]
+    return out
+
+
+def _datetime_ns(values) -> np.ndarray:
+    """Convert datetime-like values to int64 nanoseconds (UTC for tz-aware)."""
+    return pd.DatetimeIndex(pd.to_datetime(values)).as_unit("ns").asi8
+
+
 def modify_trend(
     values: np.ndarray,
     timestamps: pd.Series,
@@ -281,18 +575,41 @@ def modify_trend(
     Returns:
         Values with trend applied
     """
-    timestamps = pd.to_datetime(timestamps)
+    multipliers = _trend_multipliers(timestamps, trend_type, growth_rate, params)
+
+    if isinstance(timestamps, pd.Series):
+        multipliers = pd.Series(multipliers, index=timestamps.index, name=timestamps.name)
 
-    # Calculate time delta from start (in years for growth rate)
-    start_time = timestamps.min()
-    time_delta_days = (timestamps - start_time).dt.total_seconds() / (24 * 3600)
-    time_delta_years = time_delta_days / 365.25
+    return values * multipliers
+
+
+def _trend_years(timestamps: pd.Series) -> np.ndarray:
+    """Years elapsed since the earliest timestamp (NaN for NaT)."""
+    # Computed on the int64 nanosecond view; NaT rows get NaN like Timestamp
+    # arithmetic would
+    ts_ns = _datetime_ns(timestamps)
+    valid = ts_ns != np.iinfo(np.int64).min
+    time_delta_years = np.full(len(ts_ns), np.nan)
+    if valid.any():
+        ts_valid = ts_ns[valid]
+        time_delta_years[valid] = (ts_valid - ts_valid.min()) * _NS_TO_YEARS
+    return time_delta_years
+
+
+def _trend_multipliers(
+    timestamps: pd.Series,
+    trend_type: str,
+    growth_rate: Optional[float],
+    params: Optional[dict]
+) -> np.ndarray:
+    """Per-row trend multipliers for modify_trend (see there for trend types)."""
+    time_delta_years = _trend_years(timestamps)
 
     if trend_type == "exponential":
-        # Exponential growth: value * (1 + growth_rate) ^ t
+        # Exponential growth: value * (1 + growth_rate) ^ t, as exp(t * log1p(g))
         if growth_rate is None:
             raise ValueError("exponential trend requires growth_rate")
-        multipliers = np.power(1 + growth_rate, time_delta_years)
+        multipliers = np.exp(time_delta_years * np.log1p(growth_rate))
 
     elif trend_type == "linear":
         # Linear growth: value * (1 + growth_rate * t)
@@ -312,7 +629,7 @@ def modify_trend(
     else:
         raise ValueError(f"Unknown trend type: {trend_type}. Must be 'exponential', 'linear', or 'logarithmic'")
 
-    return values * multipliers
+    return multipliers
 
 
 def modify_effect(
@@ -321,7 +638,8 @@ def modify_effect(
     effect_table_name: str,
     on: dict,
     window: dict,
-    map_spec: dict
+    map_spec: dict,
+    timestamp_col: Optional[str] = None
 ) -> np.ndarray:
     """
     Apply time-windowed effects from external event table.
@@ -333,6 +651,8 @@ def modify_effect(
         on: Join keys {local_key: effect_key}
         window: Window spec {start_col, end_col}
         map_spec: Mapping spec {field, op, default}
+        timestamp_col: Context column to match windows against (default: first
+            datetime column in context)
 
     Returns:
         Modified values with effects applied
@@ -358,13 +678,8 @@ def modify_effect(
     default = map_spec["default"]
 
     # Find timestamp column in context for window matching
-    timestamp_col = None
-    for col in context.columns:
-        if col.startswith("_effect_"):
-            continue
-        if pd.api.types.is_datetime64_any_dtype(context[col]):
-            timestamp_col = col
-            break
+    if timestamp_col is None:
+        timestamp_col = _find_timestamp_column(context)
 
     if timestamp_col is None:
         logger.warning("Effect modifier requires datetime column in context for window matching")
@@ -379,32 +694,10 @@ def modify_effect(
     # Get the effect table (stored as a single value in each row)
     effect_df = context[effect_col].iloc[0]
 
-    # For each row, find matching effects
-    for idx in range(len(values)):
-        row_timestamp = timestamps.iloc[idx]
-
-        # Filter effects by join keys
-        matching_effects = effect_df.copy()
-
-        if on:  # If there are join keys
-            for local_key, effect_key in on.items():
-                if local_key not in context.columns:
-                    continue
-                local_value = context[local_key].iloc[idx]
-                matching_effects = matching_effects[matching_effects[effect_key] == local_value]
-
-        # Filter by time window
-        if start_col in matching_effects.columns and end_col in matching_effects.columns:
-            matching_effects = matching_effects[
-                (pd.to_datetime(matching_effects[start_col]) <= row_timestamp) &
-                (pd.to_datetime(matching_effects[end_col]) >= row_timestamp)
-            ]
-
-        # Apply effect if found
-        if len(matching_effects) > 0 and field in matching_effects.columns:
-            # Use first matching effect (could aggregate multiple effects)
-            effect_value = matching_effects[field].iloc[0]
-            result[idx] = effect_value
+    if field in effect_df.columns:
+        match = _match_effects_nb if HAS_NUMBA else _match_effects
+        rows, effect_values = match(timestamps, context, effect_df, on, start_col, end_col, field)
+        result[rows] = effect_values
 
     # Apply operation
     if op == "mul":
@@ -416,6 +709,176 @@ def modify_effect(
         return values
 
 
+def add_effect_window_ns(effect_df: pd.DataFrame, window: Optional[dict]) -> pd.DataFrame:
+    """
+    Attach int64 nanosecond copies of an effect table's window bounds.
+
+    Adds a `_<col>_ns` column for each of window's start_col/end_col present
+    in effect_df, so repeated effect matching can skip datetime conversion.
+
+    Args:
+        effect_df: Effect table
+        window: Window spec {start_col, end_col}
+
+    Returns:
+        effect_df itself if nothing needs adding, otherwise a new DataFrame
+    """
+    extra = {
+        f"_{col}_ns": _datetime_ns(effect_df[col])
+        for col in ((window or {}).get("start_col"), (window or {}).get("end_col"))
+        if col in effect_df.columns and f"_{col}_ns" not in effect_df.columns
+    }
+    return effect_df.assign(**extra) if extra else effect_df
+
+
+def _window_ns(effect_df: pd.DataFrame, col: str) -> np.ndarray:
+    """Window bound as int64 ns, preferring a precomputed `_<col>_ns` column."""
+    ns_col = f"_{col}_ns"
+    if ns_col in effect_df.columns:
+        return effect_df[ns_col].to_numpy(dtype=np.int64)
+    return _datetime_ns(effect_df[col])
+
+
+def _match_effects(
+    timestamps: pd.Series,
+    context: pd.DataFrame,
+    effect_df: pd.DataFrame,
+    on: dict,
+    start_col: str,
+    end_col: str,
+    field: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the first matching effect row for each context row.
+
+    Joins rows to effects on the `on` keys (cross join when there are none),
+    keeps pairs whose timestamp falls inside [start_col, end_col], and picks
+    the earliest effect row per context row, mirroring a row-by-row scan.
+
+    Returns:
+        Tuple of (matched row positions, effect field values for those rows)
+    """
+    keys = [
+        (local_key, effect_key)
+        for local_key, effect_key in (on or {}).items()
+        if local_key in context.columns
+    ]
+    key_names = [f"_key{i}" for i in range(len(keys))]
+
+    left = pd.DataFrame({"_row": np.arange(len(timestamps)), "_ts": _datetime_ns(timestamps).view("datetime64[ns]")})
+    right = pd.DataFrame({"_effect_pos": np.arange(len(effect_df)), "_value": effect_df[field].values})
+    for name, (local_key, effect_key) in zip(key_names, keys):
+        left[name] = context[local_key].values
+        right[name] = effect_df[effect_key].values
+
+    has_window = start_col in effect_df.columns and end_col in effect_df.columns
+    if has_window:
+        right["_start"] = _window_ns(effect_df, start_col).view("datetime64[ns]")
+        right["_end"] = _window_ns(effect_df, end_col).view("datetime64[ns]")
+
+    if key_names:
+        # Null keys never compare equal row-by-row, so they can never match
+        right = right.dropna(subset=key_names)
+        merged = left.merge(right, on=key_names, how="inner")
+    else:
+        merged = left.merge(right, how="cross")
+
+    if has_window:
+        merged = merged[(merged["_start"] <= merged["_ts"]) & (merged["_end"] >= merged["_ts"])]
+
+    first = merged.sort_values(["_row", "_effect_pos"], kind="stable").drop_duplicates("_row")
+    return first["_row"].to_numpy(), first["_value"].to_numpy()
+
+
+def _match_effects_nb(
+    timestamps: pd.Series,
+    context: pd.DataFrame,
+    effect_df: pd.DataFrame,
+    on: dict,
+    start_col: str,
+    end_col: str,
+    field: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Numba version of _match_effects using a sorted interval search.
+
+    Join keys are factorized into integer codes shared by rows and effects.
+    Effects are sorted by (key code, end), so each row binary-searches its
+    key's segment for the first effect ending at or after its timestamp and
+    scans forward for the earliest (in table order) effect that has started.
+    """
+    keys = [
+        (local_key, effect_key)
+        for local_key, effect_key in (on or {}).items()
+        if local_key in context.columns
+    ]
+    n_rows = len(timestamps)
+    n_effects = len(effect_df)
+
+    # Shared integer codes for the join key tuple; -1 marks a null key
+    if keys:
+        stacked = pd.DataFrame({
+            f"_key{i}": np.concatenate([effect_df[effect_key].to_numpy(), context[local_key].to_numpy()])
+            for i, (local_key, effect_key) in enumerate(keys)
+        })
+        codes = (
+            stacked.groupby(list(stacked.columns), sort=False, dropna=True)
+            .ngroup()
+            .fillna(-1)
+            .to_numpy(dtype=np.int64)
+        )
+    else:
+        codes = np.zeros(n_effects + n_rows, dtype=np.int64)
+    effect_codes, row_codes = codes[:n_effects], codes[n_effects:]
+
+    if start_col in effect_df.columns and end_col in effect_df.columns:
+        ts_ns = _datetime_ns(timestamps)
+        start_ns = _window_ns(effect_df, start_col)
+        end_ns = _window_ns(effect_df, end_col)
+
+        # NaT never satisfies a window comparison
+        nat = np.iinfo(np.int64).min
+        effect_codes = np.where((start_ns == nat) | (end_ns == nat), -1, effect_codes)
+        row_codes = np.where(ts_ns == nat, -1, row_codes)
+    else:
+        ts_ns = np.zeros(n_rows, dtype=np.int64)
+        start_ns = np.zeros(n_effects, dtype=np.int64)
+        end_ns = np.zeros(n_effects, dtype=np.int64)
+
+    valid = np.flatnonzero(effect_codes >= 0)
+    order = valid[np.lexsort((end_ns[valid], effect_codes[valid]))]
+    sorted_codes = effect_codes[order]
+    n_codes = int(max(effect_codes.max(initial=-1), row_codes.max(initial=-1))) + 1
+    seg_starts = np.searchsorted(sorted_codes, np.arange(n_codes), side="left")
+    seg_ends = np.searchsorted(sorted_codes, np.arange(n_codes), side="right")
+
+    matched = np.empty(n_rows, dtype=np.int64)
+    _effect_match_kernel(
+        row_codes, ts_ns, seg_starts, seg_ends,
+        end_ns[order], start_ns[order], order.astype(np.int64), matched
+    )
+
+    rows = np.flatnonzero(matched >= 0)
+    return rows, effect_df[field].to_numpy()[matched[rows]]
+
+
+@njit(parallel=True, cache=True)
+def _effect_match_kernel(row_codes, ts_ns, seg_starts, seg_ends, sorted_end, sorted_start,
+                         sorted_pos, out):
+    for i in prange(row_codes.shape[0]):
+        best = -1
+        code = row_codes[i]
+        if code >= 0:
+            lo = seg_starts[code]
+            hi = seg_ends[code]
+            t = ts_ns[i]
+            j = lo + np.searchsorted(sorted_end[lo:hi], t)
+            for m in range(j, hi):
+                if sorted_start[m] <= t and (best < 0 or sorted_pos[m] < best):
+                    best = sorted_pos[m]
+        out[i] = best
+
+
 # ============================================================================
 # Outlier Injection
 # ============================================================================
@@ -425,7 +888,8 @@ def modify_outliers(
     rng: np.random.Generator,
     rate: float,
     mode: str,
-    magnitude_dist: dict
+    magnitude_dist: dict,
+    scratch: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Inject outliers into values.
@@ -433,21 +897,27 @@ def modify_outliers(
     Args:
         values: Input values
         rng: Random generator
-        rate: Fraction of values to make outliers (e.g., 0.01 = 1%)
+        rate: Probability of each value becoming an outlier (e.g., 0.01 = ~1%)
         mode: "spike" (increase) or "drop" (decrease)
         magnitude_dist: Distribution spec for magnitude {type, params}
+        scratch: Optional float64 buffer of len(values) for the selection draw
 
     Returns:
         Values with outliers injected
     """
     n = len(values)
-    n_outliers = int(n * rate)
 
-    if n_outliers == 0:
+    if rate <= 0 or n == 0:
         return values
 
-    # Select random indices for outliers
-    outlier_indices = rng.choice(n, size=n_outliers, replace=False)
+    # Each value is an outlier with probability `rate`; flatnonzero yields
+    # sorted indices, so the scatter below walks memory in order
+    draws = rng.random(n) if scratch is None else rng.random(out=scratch)
+    outlier_indices = np.flatnonzero(draws < rate)
+    n_outliers = len(outlier_indices)
+
+    if n_outliers == 0:
+        return values
 
     # Generate magnitude multipliers
     from datagen.core.generators.primitives import generate_distribution
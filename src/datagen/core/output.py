@@ -1,15 +1,50 @@
 """Output management for Parquet, CSV, and metadata."""
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.csv as pacsv
 import pyarrow.parquet as pq
+import csv
+import io
 import json
+import math
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional: pip install -e ".[fast]"
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Parquet writer settings: zstd shrinks repeated-value columns well at
+# snappy-like speed, and bounded row groups keep wide string tables from
+# materializing a single huge column chunk.
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "row_group_size": 128 * 1024,
+    "data_page_size": 1 << 20,
+    "write_statistics": True,
+}
+
+# Threads used to convert DataFrame columns to Arrow
+ARROW_CONVERT_THREADS = min(8, os.cpu_count() or 1)
+
+# Arrow writes the body only: the header is written by the csv module so it is
+# quoted exactly like pandas, and quoting_style="none" makes Arrow reject any
+# value that would need quotes, in which case write_csv falls back to pandas.
+CSV_WRITE_OPTIONS = pacsv.WriteOptions(
+    include_header=False, batch_size=64 * 1024, quoting_style="none"
+)
+
 
 def write_parquet(df: pd.DataFrame, path: Path):
     """
@@ -22,15 +57,69 @@ def write_parquet(df: pd.DataFrame, path: Path):
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert to PyArrow table for better control
-    table = pa.Table.from_pandas(df)
+    # Convert to PyArrow table for better control, converting columns in parallel;
+    # Arrow-backed (ArrowDtype) columns are passed through without a copy
+    table = pa.Table.from_pandas(df, preserve_index=False, nthreads=ARROW_CONVERT_THREADS)
 
     # Write with compression
-    pq.write_table(table, path, compression='snappy')
+    pq.write_table(table, path, **PARQUET_WRITE_OPTIONS)
 
     logger.debug(f"Wrote Parquet: {path} ({len(df)} rows, {len(df.columns)} columns)")
 
 
+# Arrow's Parquet encoder releases the GIL, so independent table writes can
+# run in parallel with each other and with the caller. The pool is created on
+# first use so importing this module does not start it.
+_IO_POOL: Optional[ThreadPoolExecutor] = None
+_IO_POOL_LOCK = threading.Lock()
+
+
+def _io_pool() -> ThreadPoolExecutor:
+    """Get the shared IO thread pool, creating it on first use."""
+    global _IO_POOL
+    with _IO_POOL_LOCK:
+        if _IO_POOL is None:
+            _IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="datagen-io")
+        return _IO_POOL
+
+
+def write_parquet_async(df: pd.DataFrame, path: Path) -> Future:
+    """
+    Queue a write_parquet call on the IO thread pool.
+
+    The DataFrame must not be modified until the write completes; pass the
+    returned future to flush() before relying on the file.
+
+    Args:
+        df: DataFrame to write
+        path: Output file path
+
+    Returns:
+        Future resolving when the file has been written
+    """
+    return _io_pool().submit(write_parquet, df, path)
+
+
+def flush(futures: Iterable[Future]):
+    """
+    Wait for the given asynchronous writes to finish.
+
+    Only the caller's own futures are awaited, so concurrent callers sharing
+    the IO pool do not block on or see errors from each other's writes.
+
+    Args:
+        futures: Futures returned by write_parquet_async
+
+    Raises:
+        Exception: The first error raised by one of the writes, if any
+    """
+    pending = list(futures)
+
+    wait(pending)
+    for future in pending:
+        future.result()
+
+
 def write_metadata(metadata: dict, path: Path):
     """
     Write metadata JSON file.
@@ -42,12 +131,57 @@ def write_metadata(metadata: dict, path: Path):
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, 'w') as f:
-        json.dump(metadata, f, indent=2, default=str)
+    _dump_json(metadata, path)
 
     logger.debug(f"Wrote metadata: {path}")
 
 
+def _json_default(obj):
+    """Serialize NumPy scalars/arrays as plain JSON values, anything else via str."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def _nan_to_none(obj: Any) -> Any:
+    """Replace non-finite floats (which orjson writes as null) with None, recursively."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _nan_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(value) for value in obj]
+    if isinstance(obj, (np.ndarray, np.floating)):
+        return _nan_to_none(obj.tolist())
+    return obj
+
+
+def _dump_json(obj: Any, path: Path):
+    """
+    Write obj as indented UTF-8 JSON, using orjson when it is installed.
+
+    Both paths produce the same document: datetimes go through _json_default
+    (str, space-separated), NaN/inf become null and non-ASCII is written raw.
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                obj,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                ),
+                default=_json_default,
+            ))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(_nan_to_none(obj), f, indent=2, ensure_ascii=False, default=_json_default)
+
+
 def read_parquet(path: Path) -> pd.DataFrame:
     """
     Read Parquet file to DataFrame.
@@ -71,10 +205,63 @@ def read_metadata(path: Path) -> dict:
     Returns:
         Metadata dictionary
     """
-    with open(path) as f:
+    with open(path, encoding='utf-8') as f:
         return json.load(f)
 
 
+def _csv_header(columns) -> bytes:
+    """Format the header row the way df.to_csv does (csv module, minimal quoting)."""
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerow(columns)
+    return buf.getvalue().encode('utf-8')
+
+
+def _csv_arrow_table(df: pd.DataFrame) -> Optional[pa.Table]:
+    """
+    Build an Arrow table whose CSV rendering matches df.to_csv(index=False).
+
+    Integer and string columns are written by Arrow as-is; float, bool and
+    datetime columns are pre-formatted the way pandas formats them. Returns
+    None when some column (or the frame shape) has no byte-exact Arrow form.
+    """
+    # pandas quotes an empty single-field row as "" and uses os.linesep
+    if len(df.columns) < 2 or df.columns.has_duplicates or os.linesep != "\n":
+        return None
+    if not all(isinstance(name, str) for name in df.columns):
+        return None
+
+    arrays = []
+    for name in df.columns:
+        series = df[name]
+        dtype = series.dtype
+        is_datetime = isinstance(dtype, np.dtype) and dtype.kind == "M"
+        if is_datetime or isinstance(dtype, pd.DatetimeTZDtype):
+            # pandas drops the time part when every value is at midnight
+            arrays.append(pa.array(series.astype(str).to_numpy(), mask=series.isna().to_numpy()))
+        elif not isinstance(dtype, np.dtype):
+            return None
+        elif dtype.kind in "iu":
+            arrays.append(pa.array(series.to_numpy()))
+        elif dtype.kind == "f":
+            # NumPy's shortest repr ("1.0", "1e-05"), as used by to_csv
+            values = series.to_numpy()
+            arrays.append(pa.array(values.astype(str), mask=np.isnan(values)))
+        elif dtype.kind == "b":
+            arrays.append(pa.array(np.where(series.to_numpy(), "True", "False")))
+        elif dtype.kind == "O":
+            try:
+                array = pa.array(series.to_numpy(), from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                return None
+            if not pa.types.is_string(array.type):
+                return None
+            arrays.append(array)
+        else:
+            return None
+
+    return pa.table(arrays, names=list(df.columns))
+
+
 def write_csv(df: pd.DataFrame, path: Path, include_index: bool = False):
     """
     Write DataFrame to CSV file.
@@ -87,6 +274,21 @@ def write_csv(df: pd.DataFrame, path: Path, include_index: bool = False):
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Arrow's multithreaded C++ writer for frames whose cells it formats
+    # byte-for-byte like df.to_csv; pandas handles everything else
+    table = None if include_index else _csv_arrow_table(df)
+    if table is not None:
+        try:
+            with open(path, 'wb') as f:
+                f.write(_csv_header(df.columns))
+                pacsv.write_csv(table, f, write_options=CSV_WRITE_OPTIONS)
+        except pa.ArrowInvalid:
+            # A value needs quoting (delimiter, quote or newline inside)
+            pass
+        else:
+            logger.debug(f"Wrote CSV: {path} ({len(df)} rows, {len(df.columns)} columns)")
+            return
+
     # Write CSV with UTF-8 encoding
     df.to_csv(path, index=include_index, encoding='utf-8')
 
@@ -136,8 +338,7 @@ def write_table_metadata(
         if "enclosure" in schema_info:
             metadata["enclosure"] = schema_info["enclosure"]
 
-    with open(path, 'w') as f:
-        json.dump(metadata, f, indent=2, default=str)
+    _dump_json(metadata, path)
 
     logger.debug(f"Wrote table metadata: {path}")
 
@@ -177,7 +378,6 @@ def write_enhanced_metadata(
     if generation_stats:
         metadata["generation_stats"] = generation_stats
 
-    with open(output_path, 'w') as f:
-        json.dump(metadata, f, indent=2, default=str)
+    _dump_json(metadata, output_path)
 
     logger.debug(f"Wrote enhanced metadata: {output_path}")
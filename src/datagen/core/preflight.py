@@ -5,13 +5,50 @@ Validates that a schema will successfully generate without runtime errors.
 This catches all potential issues BEFORE generation starts.
 """
 
-from typing import List, Set, Dict, Optional
-from faker import Faker
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import re
 
 from .schema import Dataset, Node
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional: pip install -e ".[fast]"
+    process = None
+
+
+@lru_cache(maxsize=1)
+def _valid_faker_methods() -> frozenset:
+    """Names available on a default Faker instance, built once per process."""
+    # Imported here so schemas without faker columns never pay the import cost
+    from faker import Faker
+
+    return frozenset(dir(Faker()))
+
+
+@lru_cache(maxsize=1)
+def _faker_method_catalog() -> tuple:
+    """Sorted Faker method names and their lowercased forms, for suggestions."""
+    methods = tuple(sorted(_valid_faker_methods()))
+    return methods, tuple(m.lower() for m in methods)
+
+
+def _similar_faker_methods(method: str, limit: int = 3) -> List[str]:
+    """Suggest up to `limit` Faker methods resembling an unknown method name."""
+    methods, lowered = _faker_method_catalog()
+    target = method.lower()
+
+    if process is not None:
+        matches = process.extract(target, lowered, scorer=fuzz.partial_ratio, limit=limit, score_cutoff=60)
+        return [methods[index] for _, _, index in matches]
+
+    return [m for m, low in zip(methods, lowered) if target in low or low in target][:limit]
+
+
+# Shared fallback for lookups of tables that do not exist
+_EMPTY_COLUMNS: frozenset = frozenset()
+
 
 class PreflightError:
     """A single preflight validation error."""
@@ -22,11 +59,16 @@ class PreflightError:
         self.message = message
         self.suggestion = suggestion
 
-    def __str__(self):
-        result = f"[{self.severity.upper()}] {self.location}: {self.message}"
+    def render(self, out: List[str]):
+        """Append this error's report lines to `out`."""
+        out.append(f"[{self.severity.upper()}] {self.location}: {self.message}")
         if self.suggestion:
-            result += f"\n  Suggestion: {self.suggestion}"
-        return result
+            out.append(f"  Suggestion: {self.suggestion}")
+
+    def __str__(self):
+        lines: List[str] = []
+        self.render(lines)
+        return "\n".join(lines)
 
 
 class PreflightValidator:
@@ -39,411 +81,334 @@ class PreflightValidator:
 
         # Build lookup tables
         self.nodes_by_id: Dict[str, Node] = {n.id: n for n in dataset.nodes}
-        self.columns_by_table: Dict[str, Set[str]] = {}
-        for node in dataset.nodes:
-            self.columns_by_table[node.id] = {col.name for col in node.columns}
-
-    def validate_all(self) -> bool:
-        """Run all preflight validations. Returns True if no errors."""
-        self._validate_lookup_references()
-        self._validate_faker_methods()
-        self._validate_expression_syntax()
-        self._validate_modifier_compatibility()
-        self._validate_constraint_references()
-        self._validate_target_references()
-        self._validate_parent_references()
-        self._validate_fanout_rules()
-        self._validate_locale_references()
-        self._validate_column_types()
+        self.columns_by_table: Dict[str, frozenset] = {
+            node.id: frozenset(col.name for col in node.columns) for node in dataset.nodes
+        }
+
+        # Every valid "table.column" reference, so well-formed references cost
+        # one set probe; the split into table/column only happens for errors
+        self.valid_refs: frozenset = frozenset(
+            f"{table}.{column}" for table, columns in self.columns_by_table.items() for column in columns
+        )
+
+        # Suggestion text shared by every missing-table error, and per-table
+        # column lists materialized on first use by _column_list
+        self._tables_suggestion = f"Available tables: {list(self.nodes_by_id.keys())}"
+        self._column_lists: Dict[str, List[str]] = {}
+
+    def _column_list(self, table: str) -> List[str]:
+        """Columns of a table as listed in suggestions, built once per table."""
+        columns = self._column_lists.get(table)
+        if columns is None:
+            columns = self._column_lists[table] = list(self.columns_by_table.get(table, _EMPTY_COLUMNS))
+        return columns
+
+    def validate_all(self, *, fast_fail: bool = False) -> bool:
+        """
+        Run all preflight validations. Returns True if no errors.
+
+        Args:
+            fast_fail: Stop after the first pass that reports an error
+        """
+        passes = (
+            self._validate_columns,
+            self._validate_constraint_references,
+            self._validate_target_references,
+            self._validate_parent_references,
+            self._validate_fanout_rules,
+        )
+        for validate in passes:
+            validate()
+            if fast_fail and self.errors:
+                return False
 
         return len(self.errors) == 0
 
-    def _validate_lookup_references(self):
-        """Validate all lookup references point to existing table.column."""
-        for node in self.dataset.nodes:
-            for col in node.columns:
-                if not col.generator:
-                    continue
-
-                # Check lookup generator
-                if isinstance(col.generator, dict) and "lookup" in col.generator:
-                    lookup_spec = col.generator["lookup"]
-                    from_ref = lookup_spec.get("from")
-
-                    if not from_ref:
-                        self.errors.append(PreflightError(
-                            "error",
-                            f"nodes.{node.id}.columns.{col.name}.generator.lookup",
-                            "Missing 'from' field in lookup generator",
-                            "Add 'from': 'table.column'"
-                        ))
-                        continue
-
-                    if "." not in from_ref:
-                        self.errors.append(PreflightError(
-                            "error",
-                            f"nodes.{node.id}.columns.{col.name}.generator.lookup.from",
-                            f"Invalid lookup reference: '{from_ref}'. Must be in 'table.column' format",
-                            f"Change to 'table.column' format, e.g., 'customer.customer_id'"
-                        ))
-                        continue
-
-                    ref_table, ref_column = from_ref.split(".", 1)
-
-                    # Check table exists
-                    if ref_table not in self.nodes_by_id:
-                        self.errors.append(PreflightError(
-                            "error",
-                            f"nodes.{node.id}.columns.{col.name}.generator.lookup.from",
-                            f"Lookup references non-existent table: '{ref_table}'",
-                            f"Available tables: {list(self.nodes_by_id.keys())}"
-                        ))
-                        continue
-
-                    # Check column exists in that table
-                    if ref_column not in self.columns_by_table.get(ref_table, set()):
-                        self.errors.append(PreflightError(
-                            "error",
-                            f"nodes.{node.id}.columns.{col.name}.generator.lookup.from",
-                            f"Lookup references non-existent column: '{ref_table}.{ref_column}'",
-                            f"Available columns in {ref_table}: {list(self.columns_by_table.get(ref_table, []))}"
-                        ))
-
-    def _validate_faker_methods(self):
-        """Validate all Faker methods are real."""
-        faker = Faker()
-        valid_methods = set(dir(faker))
-
-        for node in self.dataset.nodes:
-            for col in node.columns:
-                if not col.generator:
-                    continue
-
-                if isinstance(col.generator, dict) and "faker" in col.generator:
-                    faker_spec = col.generator["faker"]
-                    method = faker_spec.get("method")
-
-                    if not method:
-                        self.errors.append(PreflightError(
-                            "error",
-                            f"nodes.{node.id}.columns.{col.name}.generator.faker",
-                            "Missing 'method' field in faker generator",
-                            "Add 'method': 'name', 'email', 'address', etc."
-                        ))
-                        continue
-
-                    if method not in valid_methods:
-                        # Try to suggest similar methods
-                        similar = [m for m in valid_methods if method.lower() in m.lower() or m.lower() in method.lower()]
-                        suggestion = f"Method '{method}' not found in Faker. "
-                        if similar:
-                            suggestion += f"Did you mean: {similar[:3]}?"
-                        else:
-                            suggestion += "See https://faker.readthedocs.io/en/master/providers.html"
-
-                        self.errors.append(PreflightError(
-                            "error",
-                            f"nodes.{node.id}.columns.{col.name}.generator.faker.method",
-                            f"Invalid Faker method: '{method}'",
-                            suggestion
-                        ))
+    def _validate_columns(self):
+        """Validate every column's generator and modifiers in a single traversal."""
+        valid_methods = None  # fetched on the first faker column
 
-    def _validate_expression_syntax(self):
-        """Validate all expression generators have valid pandas eval syntax."""
         for node in self.dataset.nodes:
             for col in node.columns:
-                if not col.generator:
-                    continue
-
-                if isinstance(col.generator, dict) and "expression" in col.generator:
-                    expr_spec = col.generator["expression"]
-                    expr = expr_spec.get("code")
+                generator = col.generator if isinstance(col.generator, dict) else {}
+                faker_spec = generator.get("faker")
+                if faker_spec is not None:
+                    method, locale_from = faker_spec.get("method"), faker_spec.get("locale_from")
+                    if valid_methods is None:
+                        valid_methods = _valid_faker_methods()
+
+                if "lookup" in generator:
+                    self._check_lookup(node, col, generator["lookup"])
+                if faker_spec is not None:
+                    self._check_faker_method(node, col, method, valid_methods)
+                if "expression" in generator:
+                    self._check_expression(node, col, generator["expression"])
+                if col.modifiers:
+                    self._check_modifiers(node, col)
+                if faker_spec is not None and locale_from:
+                    self._check_locale(node, col, locale_from)
+                self._check_column_type(node, col, generator)
+
+    def _check_lookup(self, node: Node, col, lookup_spec: dict):
+        """Validate a lookup reference points to an existing table.column."""
+        from_ref = lookup_spec.get("from")
+
+        if not from_ref:
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.lookup",
+                "Missing 'from' field in lookup generator",
+                "Add 'from': 'table.column'"
+            ))
+            return
 
-                    if not expr:
-                        self.errors.append(PreflightError(
-                            "error",
-                            f"nodes.{node.id}.columns.{col.name}.generator.expression",
-                            "Missing 'code' field in expression generator",
-                            "Add 'code': 'column1 + column2'"
-                        ))
-                        continue
+        if from_ref in self.valid_refs:
+            return
 
-                    # Basic validation: check that expression is a non-empty string
-                    # Full validation happens at generation time when columns are available
-                    if not isinstance(expr, str) or not expr.strip():
-                        self.errors.append(PreflightError(
-                            "error",
-                            f"nodes.{node.id}.columns.{col.name}.generator.expression.code",
-                            "Expression code must be a non-empty string",
-                            "Expression must be valid pandas eval syntax like 'column1 * column2'"
-                        ))
+        ref_table, sep, ref_column = from_ref.partition(".")
+        if not sep:
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.lookup.from",
+                f"Invalid lookup reference: '{from_ref}'. Must be in 'table.column' format",
+                f"Change to 'table.column' format, e.g., 'customer.customer_id'"
+            ))
+            return
 
-    def _validate_modifier_compatibility(self):
-        """Validate modifiers are compatible with column types."""
-        for node in self.dataset.nodes:
-            for col in node.columns:
-                if not col.modifiers:
-                    continue
+        # Check table exists
+        if ref_table not in self.nodes_by_id:
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.lookup.from",
+                f"Lookup references non-existent table: '{ref_table}'",
+                self._tables_suggestion
+            ))
+            return
 
-                for i, modifier in enumerate(col.modifiers):
-                    if hasattr(modifier, 'transform'):
-                        transform = modifier.transform
-                        args = modifier.args if hasattr(modifier, 'args') else {}
-                    else:
-                        transform = modifier.get("transform")
-                        args = modifier.get("args", {})
-
-                    # Validate seasonality modifier
-                    if transform == "seasonality":
-                        dimension = args.get("dimension")
-                        weights = args.get("weights", [])
-
-                        if not dimension:
-                            self.errors.append(PreflightError(
-                                "error",
-                                f"nodes.{node.id}.columns.{col.name}.modifiers[{i}]",
-                                "Seasonality modifier missing 'dimension'",
-                                "Add 'dimension': 'hour', 'dow', or 'month'"
-                            ))
-                            continue
-
-                        if dimension not in ["hour", "dow", "month"]:
-                            self.errors.append(PreflightError(
-                                "error",
-                                f"nodes.{node.id}.columns.{col.name}.modifiers[{i}].dimension",
-                                f"Invalid seasonality dimension: '{dimension}'",
-                                "Use 'hour' (24), 'dow' (7), or 'month' (12)"
-                            ))
-
-                        # Validate weights count
-                        expected_count = {"hour": 24, "dow": 7, "month": 12}.get(dimension, 0)
-                        if expected_count and len(weights) != expected_count:
-                            self.warnings.append(PreflightError(
-                                "warning",
-                                f"nodes.{node.id}.columns.{col.name}.modifiers[{i}].weights",
-                                f"Seasonality weights for '{dimension}' should have {expected_count} values, got {len(weights)}",
-                                f"Weights will be padded/truncated to {expected_count}"
-                            ))
-
-                        # Check if column is datetime type
-                        if col.type not in ["datetime", "date"]:
-                            self.warnings.append(PreflightError(
-                                "warning",
-                                f"nodes.{node.id}.columns.{col.name}.modifiers[{i}]",
-                                f"Seasonality modifier on non-datetime column (type: {col.type})",
-                                "Seasonality works best on datetime/date columns"
-                            ))
+        # Check column exists in that table
+        if ref_column not in self.columns_by_table.get(ref_table, _EMPTY_COLUMNS):
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.lookup.from",
+                f"Lookup references non-existent column: '{ref_table}.{ref_column}'",
+                f"Available columns in {ref_table}: {self._column_list(ref_table)}"
+            ))
+
+    def _check_faker_method(self, node: Node, col, method: Optional[str], valid_methods: frozenset):
+        """Validate a Faker generator names a real Faker method."""
+        if not method:
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.faker",
+                "Missing 'method' field in faker generator",
+                "Add 'method': 'name', 'email', 'address', etc."
+            ))
+            return
 
-    def _validate_constraint_references(self):
-        """Validate all constraint references point to existing table.column."""
-        constraints = self.dataset.constraints
+        if method not in valid_methods:
+            # Try to suggest similar methods
+            similar = _similar_faker_methods(method)
+            suggestion = f"Method '{method}' not found in Faker. "
+            if similar:
+                suggestion += f"Did you mean: {similar}?"
+            else:
+                suggestion += "See https://faker.readthedocs.io/en/master/providers.html"
+
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.faker.method",
+                f"Invalid Faker method: '{method}'",
+                suggestion
+            ))
+
+    def _check_expression(self, node: Node, col, expr_spec: dict):
+        """Validate an expression generator has non-empty code."""
+        expr = expr_spec.get("code")
+
+        if not expr:
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.expression",
+                "Missing 'code' field in expression generator",
+                "Add 'code': 'column1 + column2'"
+            ))
+            return
 
-        # Validate unique constraints
-        if constraints.unique:
-            for ref in constraints.unique:
-                if "." not in ref:
+        # Basic validation: check that expression is a non-empty string
+        # Full validation happens at generation time when columns are available
+        if not isinstance(expr, str) or not expr.strip():
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.expression.code",
+                "Expression code must be a non-empty string",
+                "Expression must be valid pandas eval syntax like 'column1 * column2'"
+            ))
+
+    def _check_modifiers(self, node: Node, col):
+        """Validate a column's modifiers are compatible with its type."""
+        # Column.modifiers is typed as ModifierSpec, so dict input was already
+        # normalized to models when the Dataset was validated
+        for i, modifier in enumerate(col.modifiers):
+            transform, args = modifier.transform, modifier.args
+
+            # Validate seasonality modifier
+            if transform == "seasonality":
+                dimension = args.get("dimension")
+                weights = args.get("weights", [])
+
+                if not dimension:
                     self.errors.append(PreflightError(
                         "error",
-                        f"constraints.unique",
-                        f"Invalid unique constraint reference: '{ref}'. Must be 'table.column'",
-                        "Use format 'table.column'"
+                        f"nodes.{node.id}.columns.{col.name}.modifiers[{i}]",
+                        "Seasonality modifier missing 'dimension'",
+                        "Add 'dimension': 'hour', 'dow', or 'month'"
                     ))
                     continue
 
-                table, column = ref.split(".", 1)
-                if table not in self.nodes_by_id:
+                if dimension not in ["hour", "dow", "month"]:
                     self.errors.append(PreflightError(
                         "error",
-                        f"constraints.unique",
-                        f"Unique constraint references non-existent table: '{table}'",
-                        f"Available tables: {list(self.nodes_by_id.keys())}"
-                    ))
-                elif column not in self.columns_by_table.get(table, set()):
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.unique",
-                        f"Unique constraint references non-existent column: '{table}.{column}'",
-                        f"Available columns: {list(self.columns_by_table.get(table, []))}"
+                        f"nodes.{node.id}.columns.{col.name}.modifiers[{i}].dimension",
+                        f"Invalid seasonality dimension: '{dimension}'",
+                        "Use 'hour' (24), 'dow' (7), or 'month' (12)"
                     ))
 
-        # Validate foreign key constraints
-        if constraints.foreign_keys:
-            for fk in constraints.foreign_keys:
-                # Validate from reference
-                if "." not in fk.from_:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.foreign_keys",
-                        f"Invalid FK 'from' reference: '{fk.from_}'. Must be 'table.column'",
-                        "Use format 'table.column'"
+                # Validate weights count
+                expected_count = {"hour": 24, "dow": 7, "month": 12}.get(dimension, 0)
+                if expected_count and len(weights) != expected_count:
+                    self.warnings.append(PreflightError(
+                        "warning",
+                        f"nodes.{node.id}.columns.{col.name}.modifiers[{i}].weights",
+                        f"Seasonality weights for '{dimension}' should have {expected_count} values, got {len(weights)}",
+                        f"Weights will be padded/truncated to {expected_count}"
                     ))
-                    continue
 
-                from_table, from_col = fk.from_.split(".", 1)
-                if from_table not in self.nodes_by_id:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.foreign_keys.from",
-                        f"FK references non-existent table: '{from_table}'",
-                        f"Available tables: {list(self.nodes_by_id.keys())}"
-                    ))
-                elif from_col not in self.columns_by_table.get(from_table, set()):
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.foreign_keys.from",
-                        f"FK references non-existent column: '{from_table}.{from_col}'",
-                        f"Available columns: {list(self.columns_by_table.get(from_table, []))}"
+                # Check if column is datetime type
+                if col.type not in ["datetime", "date"]:
+                    self.warnings.append(PreflightError(
+                        "warning",
+                        f"nodes.{node.id}.columns.{col.name}.modifiers[{i}]",
+                        f"Seasonality modifier on non-datetime column (type: {col.type})",
+                        "Seasonality works best on datetime/date columns"
                     ))
 
-                # Validate to reference
-                if "." not in fk.to:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.foreign_keys",
-                        f"Invalid FK 'to' reference: '{fk.to}'. Must be 'table.column'",
-                        "Use format 'table.column'"
-                    ))
-                    continue
+    def _check_locale(self, node: Node, col, locale_from: str):
+        """Validate a Faker locale_from points to a column in the same table."""
+        if locale_from not in self.columns_by_table.get(node.id, _EMPTY_COLUMNS):
+            self.errors.append(PreflightError(
+                "error",
+                f"nodes.{node.id}.columns.{col.name}.generator.faker.locale_from",
+                f"Faker locale_from references non-existent column: '{locale_from}'",
+                f"Available columns in {node.id}: {self._column_list(node.id)}"
+            ))
+
+    def _check_column_type(self, node: Node, col, generator: dict):
+        """Validate column type compatibility with its generator."""
+        # datetime_series should be on datetime/date columns
+        if "datetime_series" in generator and col.type not in ["datetime", "date"]:
+            self.warnings.append(PreflightError(
+                "warning",
+                f"nodes.{node.id}.columns.{col.name}",
+                f"datetime_series generator on non-datetime column (type: {col.type})",
+                "Consider changing column type to 'datetime' or 'date'"
+            ))
+
+        # distribution should be on numeric columns
+        if "distribution" in generator and col.type not in ["int", "float"]:
+            self.warnings.append(PreflightError(
+                "warning",
+                f"nodes.{node.id}.columns.{col.name}",
+                f"distribution generator on non-numeric column (type: {col.type})",
+                "Consider changing column type to 'int' or 'float'"
+            ))
+
+    def _check_ref(self, ref: str, section: str, field: str, label: str, format_label: Optional[str] = None) -> bool:
+        """Check a constraint reference points to an existing table.column.
+
+        Args:
+            ref: Reference to check
+            section: Constraint section, used as the location of format errors
+            field: Suffix appended to section for missing table/column errors
+            label: Subject of missing table/column messages (e.g. "FK")
+            format_label: Subject of the format error; None allows bare column names
+
+        Returns:
+            False if the reference is not qualified as 'table.column'
+        """
+        if ref in self.valid_refs:
+            return True
+
+        table, sep, column = ref.partition(".")
+        if not sep:
+            if format_label is not None:
+                self.errors.append(PreflightError(
+                    "error",
+                    section,
+                    f"Invalid {format_label} reference: '{ref}'. Must be 'table.column'",
+                    "Use format 'table.column'"
+                ))
+            return False
+
+        if table not in self.nodes_by_id:
+            self.errors.append(PreflightError(
+                "error",
+                f"{section}{field}",
+                f"{label} references non-existent table: '{table}'",
+                self._tables_suggestion
+            ))
+        elif column not in self.columns_by_table.get(table, _EMPTY_COLUMNS):
+            self.errors.append(PreflightError(
+                "error",
+                f"{section}{field}",
+                f"{label} references non-existent column: '{table}.{column}'",
+                f"Available columns: {self._column_list(table)}"
+            ))
+        return True
 
-                to_table, to_col = fk.to.split(".", 1)
-                if to_table not in self.nodes_by_id:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.foreign_keys.to",
-                        f"FK references non-existent table: '{to_table}'",
-                        f"Available tables: {list(self.nodes_by_id.keys())}"
-                    ))
-                elif to_col not in self.columns_by_table.get(to_table, set()):
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.foreign_keys.to",
-                        f"FK references non-existent column: '{to_table}.{to_col}'",
-                        f"Available columns: {list(self.columns_by_table.get(to_table, []))}"
-                    ))
+    def _validate_constraint_references(self):
+        """Validate all constraint references point to existing table.column."""
+        constraints = self.dataset.constraints
+        check_ref = self._check_ref  # bound once for the per-reference loops
 
-        # Validate range constraints
-        if constraints.ranges:
-            for range_constraint in constraints.ranges:
-                if "." not in range_constraint.attr:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.ranges",
-                        f"Invalid range constraint reference: '{range_constraint.attr}'. Must be 'table.column'",
-                        "Use format 'table.column'"
-                    ))
-                    continue
+        for ref in constraints.unique or []:
+            check_ref(ref, "constraints.unique", "", "Unique constraint", "unique constraint")
 
-                table, column = range_constraint.attr.split(".", 1)
-                if table not in self.nodes_by_id:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.ranges.attr",
-                        f"Range constraint references non-existent table: '{table}'",
-                        f"Available tables: {list(self.nodes_by_id.keys())}"
-                    ))
-                elif column not in self.columns_by_table.get(table, set()):
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.ranges.attr",
-                        f"Range constraint references non-existent column: '{table}.{column}'",
-                        f"Available columns: {list(self.columns_by_table.get(table, []))}"
-                    ))
+        # A malformed 'from' reference skips the 'to' check
+        for fk in constraints.foreign_keys or []:
+            if check_ref(fk.from_, "constraints.foreign_keys", ".from", "FK", "FK 'from'"):
+                check_ref(fk.to, "constraints.foreign_keys", ".to", "FK", "FK 'to'")
 
-        # Validate inequality constraints
-        if constraints.inequalities:
-            for ineq in constraints.inequalities:
-                for side, ref in [("left", ineq.left), ("right", ineq.right)]:
-                    # References can be table.column or just column (same table)
-                    if "." in ref:
-                        table, column = ref.split(".", 1)
-                        if table not in self.nodes_by_id:
-                            self.errors.append(PreflightError(
-                                "error",
-                                f"constraints.inequalities.{side}",
-                                f"Inequality references non-existent table: '{table}'",
-                                f"Available tables: {list(self.nodes_by_id.keys())}"
-                            ))
-                        elif column not in self.columns_by_table.get(table, set()):
-                            self.errors.append(PreflightError(
-                                "error",
-                                f"constraints.inequalities.{side}",
-                                f"Inequality references non-existent column: '{table}.{column}'",
-                                f"Available columns: {list(self.columns_by_table.get(table, []))}"
-                            ))
-
-        # Validate pattern constraints
-        if constraints.pattern:
-            for pattern_constraint in constraints.pattern:
-                if "." not in pattern_constraint.attr:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.pattern",
-                        f"Invalid pattern constraint reference: '{pattern_constraint.attr}'. Must be 'table.column'",
-                        "Use format 'table.column'"
-                    ))
-                    continue
+        for range_constraint in constraints.ranges or []:
+            check_ref(range_constraint.attr, "constraints.ranges", ".attr", "Range constraint", "range constraint")
 
-                table, column = pattern_constraint.attr.split(".", 1)
-                if table not in self.nodes_by_id:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.pattern.attr",
-                        f"Pattern constraint references non-existent table: '{table}'",
-                        f"Available tables: {list(self.nodes_by_id.keys())}"
-                    ))
-                elif column not in self.columns_by_table.get(table, set()):
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.pattern.attr",
-                        f"Pattern constraint references non-existent column: '{table}.{column}'",
-                        f"Available columns: {list(self.columns_by_table.get(table, []))}"
-                    ))
+        # Inequality references can be table.column or just column (same table)
+        for ineq in constraints.inequalities or []:
+            for side, ref in [("left", ineq.left), ("right", ineq.right)]:
+                check_ref(ref, "constraints.inequalities", f".{side}", "Inequality")
 
-                # Validate regex syntax
-                try:
-                    re.compile(pattern_constraint.regex)
-                except re.error as e:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.pattern.regex",
-                        f"Invalid regex pattern: {e}",
-                        "Fix the regular expression syntax"
-                    ))
+        for pattern_constraint in constraints.pattern or []:
+            if not check_ref(pattern_constraint.attr, "constraints.pattern", ".attr", "Pattern constraint", "pattern constraint"):
+                continue
 
-        # Validate enum constraints
-        if constraints.enum:
-            for enum_constraint in constraints.enum:
-                if "." not in enum_constraint.attr:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.enum",
-                        f"Invalid enum constraint reference: '{enum_constraint.attr}'. Must be 'table.column'",
-                        "Use format 'table.column'"
-                    ))
-                    continue
+            # Validate regex syntax
+            try:
+                re.compile(pattern_constraint.regex)
+            except re.error as e:
+                self.errors.append(PreflightError(
+                    "error",
+                    f"constraints.pattern.regex",
+                    f"Invalid regex pattern: {e}",
+                    "Fix the regular expression syntax"
+                ))
 
-                table, column = enum_constraint.attr.split(".", 1)
-                if table not in self.nodes_by_id:
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.enum.attr",
-                        f"Enum constraint references non-existent table: '{table}'",
-                        f"Available tables: {list(self.nodes_by_id.keys())}"
-                    ))
-                elif column not in self.columns_by_table.get(table, set()):
-                    self.errors.append(PreflightError(
-                        "error",
-                        f"constraints.enum.attr",
-                        f"Enum constraint references non-existent column: '{table}.{column}'",
-                        f"Available columns: {list(self.columns_by_table.get(table, []))}"
-                    ))
+        for enum_constraint in constraints.enum or []:
+            check_ref(enum_constraint.attr, "constraints.enum", ".attr", "Enum constraint", "enum constraint")
 
     def _validate_target_references(self):
         """Validate all target references point to existing table.column."""
-        if not self.dataset.targets:
-            return
-
         targets = self.dataset.targets
+        if not targets:
+            return
 
         # Validate weekend_share target
         if targets.weekend_share:
@@ -453,14 +418,14 @@ class PreflightValidator:
                     "error",
                     f"targets.weekend_share.table",
                     f"Weekend share target references non-existent table: '{ws.table}'",
-                    f"Available tables: {list(self.nodes_by_id.keys())}"
+                    self._tables_suggestion
                 ))
-            elif ws.timestamp not in self.columns_by_table.get(ws.table, set()):
+            elif ws.timestamp not in self.columns_by_table.get(ws.table, _EMPTY_COLUMNS):
                 self.errors.append(PreflightError(
                     "error",
                     f"targets.weekend_share.timestamp",
                     f"Weekend share target references non-existent column: '{ws.table}.{ws.timestamp}'",
-                    f"Available columns: {list(self.columns_by_table.get(ws.table, []))}"
+                    f"Available columns: {self._column_list(ws.table)}"
                 ))
 
         # Validate mean_in_range target
@@ -471,14 +436,14 @@ class PreflightValidator:
                     "error",
                     f"targets.mean_in_range.table",
                     f"Mean in range target references non-existent table: '{mir.table}'",
-                    f"Available tables: {list(self.nodes_by_id.keys())}"
+                    self._tables_suggestion
                 ))
-            elif mir.column not in self.columns_by_table.get(mir.table, set()):
+            elif mir.column not in self.columns_by_table.get(mir.table, _EMPTY_COLUMNS):
                 self.errors.append(PreflightError(
                     "error",
                     f"targets.mean_in_range.column",
                     f"Mean in range target references non-existent column: '{mir.table}.{mir.column}'",
-                    f"Available columns: {list(self.columns_by_table.get(mir.table, []))}"
+                    f"Available columns: {self._column_list(mir.table)}"
                 ))
 
     def _validate_parent_references(self):
@@ -491,7 +456,7 @@ class PreflightValidator:
                             "error",
                             f"nodes.{node.id}.parents",
                             f"Fact table references non-existent parent: '{parent_id}'",
-                            f"Available tables: {list(self.nodes_by_id.keys())}"
+                            self._tables_suggestion
                         ))
 
     def _validate_fanout_rules(self):
@@ -505,53 +470,6 @@ class PreflightValidator:
                     "Remove fanout or change kind to 'fact' and add parents"
                 ))
 
-    def _validate_locale_references(self):
-        """Validate locale_from in Faker generators points to valid columns."""
-        for node in self.dataset.nodes:
-            for col in node.columns:
-                if not col.generator:
-                    continue
-
-                if isinstance(col.generator, dict) and "faker" in col.generator:
-                    faker_spec = col.generator["faker"]
-                    locale_from = faker_spec.get("locale_from")
-
-                    if locale_from:
-                        # locale_from should reference a column in the same table
-                        if locale_from not in self.columns_by_table.get(node.id, set()):
-                            self.errors.append(PreflightError(
-                                "error",
-                                f"nodes.{node.id}.columns.{col.name}.generator.faker.locale_from",
-                                f"Faker locale_from references non-existent column: '{locale_from}'",
-                                f"Available columns in {node.id}: {list(self.columns_by_table.get(node.id, []))}"
-                            ))
-
-    def _validate_column_types(self):
-        """Validate column type compatibility with generators."""
-        for node in self.dataset.nodes:
-            for col in node.columns:
-                if not col.generator:
-                    continue
-
-                if isinstance(col.generator, dict):
-                    # datetime_series should be on datetime/date columns
-                    if "datetime_series" in col.generator and col.type not in ["datetime", "date"]:
-                        self.warnings.append(PreflightError(
-                            "warning",
-                            f"nodes.{node.id}.columns.{col.name}",
-                            f"datetime_series generator on non-datetime column (type: {col.type})",
-                            "Consider changing column type to 'datetime' or 'date'"
-                        ))
-
-                    # distribution should be on numeric columns
-                    if "distribution" in col.generator and col.type not in ["int", "float"]:
-                        self.warnings.append(PreflightError(
-                            "warning",
-                            f"nodes.{node.id}.columns.{col.name}",
-                            f"distribution generator on non-numeric column (type: {col.type})",
-                            "Consider changing column type to 'int' or 'float'"
-                        ))
-
     def get_report(self) -> str:
         """Get formatted validation report."""
         lines = []
@@ -570,14 +488,14 @@ class PreflightValidator:
             lines.append(f"❌ ERRORS: {len(self.errors)}")
             lines.append("-" * 70)
             for error in self.errors:
-                lines.append(str(error))
+                error.render(lines)
                 lines.append("")
 
         if self.warnings:
             lines.append(f"⚠️  WARNINGS: {len(self.warnings)}")
             lines.append("-" * 70)
             for warning in self.warnings:
-                lines.append(str(warning))
+                warning.render(lines)
                 lines.append("")
 
         lines.append("=" * 70)
@@ -589,26 +507,54 @@ class PreflightValidator:
         return "\n".join(lines)
 
 
-def preflight_validate(dataset: Dataset) -> bool:
+# Preflight outcomes keyed by (schema key, fast_fail): (passed, report), report empty when clean
+_PREFLIGHT_CACHE: Dict[Tuple[bytes, bool], Tuple[bool, str]] = {}
+_PREFLIGHT_CACHE_SIZE = 32
+
+
+def preflight_validate(
+    dataset: Dataset, fast_fail: bool = False, schema_key: Optional[bytes] = None
+) -> bool:
     """
     Run comprehensive preflight validation on a dataset.
 
+    When schema_key is given, results are memoized under it, so re-validating
+    an unchanged schema is a dict lookup. The key must identify the schema
+    the dataset was built from (validate_schema passes the hash it already
+    computed for its own cache); without one the dataset is always validated.
+
+    Args:
+        dataset: Dataset to validate
+        fast_fail: Report only the errors of the first failing pass
+        schema_key: Optional content hash of the source schema
+
     Returns:
         True if validation passed (no errors), False otherwise.
 
     Raises:
         ValueError: If there are validation errors, with detailed report.
     """
-    validator = PreflightValidator(dataset)
-    passed = validator.validate_all()
-
+    key = (schema_key, fast_fail) if schema_key is not None else None
+    cached = _PREFLIGHT_CACHE.get(key) if key is not None else None
+    if cached is None:
+        validator = PreflightValidator(dataset)
+        passed = validator.validate_all(fast_fail=fast_fail)
+        report = validator.get_report() if not passed or validator.warnings else ""
+
+        cached = (passed, report)
+        if key is not None:
+            if len(_PREFLIGHT_CACHE) >= _PREFLIGHT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _PREFLIGHT_CACHE[next(iter(_PREFLIGHT_CACHE))]
+            _PREFLIGHT_CACHE[key] = cached
+
+    passed, report = cached
     if not passed:
-        report = validator.get_report()
         raise ValueError(f"Schema preflight validation failed:\n\n{report}")
 
-    if validator.warnings:
+    if report:
         # Print warnings but don't fail
         import sys
-        print(validator.get_report(), file=sys.stderr)
+        print(report, file=sys.stderr)
 
     return True
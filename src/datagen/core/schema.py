@@ -3,6 +3,46 @@
 from typing import Literal, Optional, Union, Any
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from datetime import datetime
+from itertools import chain
+import calendar
+import hashlib
+import json
+import re
+
+
+# weights_kind forms accepted by ChoiceGenerator besides the plain kinds;
+# the captured parameters are checked numerically in validate_choice
+_VALID_WEIGHTS_KINDS = frozenset({"uniform"})
+_ZIPF_RE = re.compile(r"zipf@(.*)", re.DOTALL)
+_HEAD_TAIL_RE = re.compile(r"head_tail@\{(.*)\}", re.DOTALL)
+
+_VALID_DIST_TYPES = frozenset({"normal", "lognormal", "uniform", "poisson"})
+
+# Fast path for the common ISO8601 shapes (date or date-time with optional
+# fraction and Z/offset suffix); time ranges are checked in the pattern and the
+# captured date against the calendar, other spellings go to fromisoformat
+_ISO8601_RE = re.compile(
+    r"(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])"
+    r"(?:[T ](?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d+)?)?(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?)?"
+)
+
+# Fallback parser for ISO8601 spellings the fast path does not cover
+_fromisoformat = datetime.fromisoformat
+
+# Weights expected per datetime_series pattern dimension
+_DIM_WEIGHT_LEN = {"hour": 24, "dow": 7, "month": 12}
+
+# Keys that select a column generator; a column must use exactly one
+_GENERATOR_KEYS = frozenset({
+    "sequence",
+    "choice",
+    "distribution",
+    "datetime_series",
+    "faker",
+    "lookup",
+    "expression",
+    "enum_list",
+})
 
 
 # ============================================================================
@@ -52,30 +92,27 @@ class ChoiceGenerator(BaseModel):
         # Validate weights_kind if provided
         if "weights_kind" in v:
             wk = v["weights_kind"]
-            valid_kinds = ["uniform"]
 
-            if wk in valid_kinds:
+            if wk in _VALID_WEIGHTS_KINDS:
                 pass  # Valid
-            elif wk.startswith("zipf@"):
+            elif zipf := _ZIPF_RE.fullmatch(wk):
                 # Validate zipf@alpha - alpha must be a float
                 try:
-                    alpha_str = wk.split("@", 1)[1]
-                    alpha = float(alpha_str)
+                    alpha = float(zipf.group(1))
                     if alpha <= 0:
                         raise ValueError(f"zipf alpha must be positive, got: {alpha}")
-                except (IndexError, ValueError):
+                except ValueError:
                     raise ValueError(
                         f"Invalid zipf weights_kind format: {wk}. Expected 'zipf@<positive_float>', e.g., 'zipf@1.5'"
                     )
             elif wk.startswith("head_tail@"):
                 # Validate head_tail@{head_share,tail_alpha} - both must be floats
                 try:
-                    params_str = wk.split("@", 1)[1]
-                    if not (params_str.startswith("{") and params_str.endswith("}")):
+                    head_tail = _HEAD_TAIL_RE.fullmatch(wk)
+                    if head_tail is None:
                         raise ValueError("head_tail parameters must be in {} braces")
 
-                    params_str = params_str[1:-1]  # Remove braces
-                    parts = [p.strip() for p in params_str.split(",")]
+                    parts = [p.strip() for p in head_tail.group(1).split(",")]
 
                     if len(parts) != 2:
                         raise ValueError(
@@ -90,7 +127,7 @@ class ChoiceGenerator(BaseModel):
                     if tail_alpha <= 0:
                         raise ValueError(f"tail_alpha must be positive, got: {tail_alpha}")
 
-                except (IndexError, ValueError) as e:
+                except ValueError as e:
                     raise ValueError(
                         f"Invalid head_tail weights_kind format: {wk}. "
                         f"Expected 'head_tail@{{head_share,tail_alpha}}' with numeric values, "
@@ -111,7 +148,7 @@ class DistributionGenerator(BaseModel):
     @classmethod
     def validate_distribution(cls, v):
         dist_type = v.get("type")
-        if dist_type not in ["normal", "lognormal", "uniform", "poisson"]:
+        if dist_type not in _VALID_DIST_TYPES:
             raise ValueError(f"Unknown distribution type: {dist_type}")
 
         if "params" not in v:
@@ -146,14 +183,14 @@ class DatetimeSeriesGenerator(BaseModel):
             pattern = v["pattern"]
             if "dimension" not in pattern:
                 raise ValueError("pattern must have 'dimension'")
-            if pattern["dimension"] not in ["hour", "dow", "month"]:
+            if pattern["dimension"] not in _DIM_WEIGHT_LEN:
                 raise ValueError("dimension must be one of: hour, dow, month")
             if "weights" not in pattern:
                 raise ValueError("pattern must have 'weights'")
 
             # Validate weights length
             weights = pattern["weights"]
-            expected_len = {"hour": 24, "dow": 7, "month": 12}[pattern["dimension"]]
+            expected_len = _DIM_WEIGHT_LEN[pattern["dimension"]]
             if len(weights) != expected_len:
                 raise ValueError(
                     f"weights for {pattern['dimension']} must have {expected_len} values"
@@ -221,6 +258,20 @@ class EnumListGenerator(BaseModel):
         return v
 
 
+# Field validators of each generator spec, keyed by generator key. Column
+# validation calls these on the nested spec dict directly rather than
+# building a throwaway generator model per column.
+_GENERATOR_VALIDATORS = {
+    "sequence": SequenceGenerator.validate_sequence,
+    "choice": ChoiceGenerator.validate_choice,
+    "distribution": DistributionGenerator.validate_distribution,
+    "datetime_series": DatetimeSeriesGenerator.validate_datetime_series,
+    "faker": FakerGenerator.validate_faker,
+    "lookup": LookupGenerator.validate_lookup,
+    "expression": ExpressionGenerator.validate_expression,
+    "enum_list": EnumListGenerator.validate_enum_list,
+}
+
 # Union of all generator types
 GeneratorSpec = Union[
     SequenceGenerator,
@@ -288,42 +339,19 @@ class Column(BaseModel):
     @classmethod
     def validate_generator(cls, v):
         # Check that exactly one generator key exists
-        valid_keys = {
-            "sequence",
-            "choice",
-            "distribution",
-            "datetime_series",
-            "faker",
-            "lookup",
-            "expression",
-            "enum_list",
-        }
-        gen_keys = set(v.keys()) & valid_keys
+        gen_keys = v.keys() & _GENERATOR_KEYS
 
         if len(gen_keys) == 0:
-            raise ValueError(f"Column must have one of: {valid_keys}")
+            raise ValueError(f"Column must have one of: {set(_GENERATOR_KEYS)}")
         if len(gen_keys) > 1:
             raise ValueError(f"Column can only have one generator, found: {gen_keys}")
 
         # Run type-specific validation
-        gen_type = list(gen_keys)[0]
-
-        if gen_type == "sequence":
-            SequenceGenerator.model_validate(v)
-        elif gen_type == "choice":
-            ChoiceGenerator.model_validate(v)
-        elif gen_type == "distribution":
-            DistributionGenerator.model_validate(v)
-        elif gen_type == "datetime_series":
-            DatetimeSeriesGenerator.model_validate(v)
-        elif gen_type == "faker":
-            FakerGenerator.model_validate(v)
-        elif gen_type == "lookup":
-            LookupGenerator.model_validate(v)
-        elif gen_type == "expression":
-            ExpressionGenerator.model_validate(v)
-        elif gen_type == "enum_list":
-            EnumListGenerator.model_validate(v)
+        (gen_type,) = gen_keys
+        spec = v[gen_type]
+        if not isinstance(spec, dict):
+            raise ValueError(f"{gen_type} must be a dict")
+        _GENERATOR_VALIDATORS[gen_type](spec)
 
         return v
 
@@ -367,8 +395,7 @@ class Node(BaseModel):
                 raise ValueError("entity nodes cannot have 'fanout'")
 
         # Ensure PK column exists
-        pk_exists = any(col.name == self.pk for col in self.columns)
-        if not pk_exists:
+        if self.pk not in {col.name for col in self.columns}:
             raise ValueError(f"pk '{self.pk}' not found in columns")
 
         return self
@@ -514,8 +541,17 @@ class Timeframe(BaseModel):
     @field_validator("start", "end")
     @classmethod
     def validate_datetime(cls, v):
+        match = _ISO8601_RE.fullmatch(v)
+        if match:
+            year, month, day = (int(part) for part in match.groups())
+            if day <= calendar.monthrange(year, month)[1]:
+                return v
+            raise ValueError(f"Invalid ISO8601 datetime: {v}")
+
+        # fromisoformat before Python 3.11 rejects a "Z" suffix; rewrite it only when present
+        iso = v[:-1] + "+00:00" if v.endswith("Z") else v
         try:
-            datetime.fromisoformat(v.replace("Z", "+00:00"))
+            _fromisoformat(iso)
         except ValueError:
             raise ValueError(f"Invalid ISO8601 datetime: {v}")
         return v
@@ -556,13 +592,13 @@ class Dataset(BaseModel):
     def validate_dataset(self):
         # Validate that all node ids are unique
         node_ids = [n.id for n in self.nodes]
-        if len(node_ids) != len(set(node_ids)):
+        node_id_set = set(node_ids)
+        if len(node_ids) != len(node_id_set):
             raise ValueError("Duplicate node ids found")
 
         # If DAG provided, validate all ids exist
         if self.dag:
-            dag_ids = {nid for level in self.dag for nid in level}
-            node_id_set = set(node_ids)
+            dag_ids = set(chain.from_iterable(self.dag))
             if dag_ids != node_id_set:
                 missing = dag_ids - node_id_set
                 extra = node_id_set - dag_ids
@@ -581,12 +617,28 @@ class Dataset(BaseModel):
 # ============================================================================
 
 
+# Structurally validated Datasets keyed by a hash of their source dict
+_VALIDATED_SCHEMA_CACHE: dict[bytes, Dataset] = {}
+_VALIDATED_SCHEMA_CACHE_SIZE = 32
+
+
+def _schema_key(schema_dict: dict) -> Optional[bytes]:
+    """Content hash of a schema dict, or None if it is not JSON-serializable."""
+    try:
+        encoded = json.dumps(schema_dict, sort_keys=True).encode("utf-8")
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
 def validate_schema(schema_dict: dict) -> Dataset:
     """
     Validate a schema dictionary against the Datagen DSL.
 
     This includes both structural validation (Pydantic) and
     comprehensive preflight validation to catch runtime errors.
+    Re-validating an identical schema dict reuses the earlier structural
+    validation and returns a fresh copy of the cached Dataset.
 
     Args:
         schema_dict: Raw schema dictionary
@@ -599,11 +651,21 @@ def validate_schema(schema_dict: dict) -> Dataset:
         ValueError: If preflight validation fails
     """
     # Step 1: Structural validation with Pydantic
-    dataset = Dataset.model_validate(schema_dict)
+    key = _schema_key(schema_dict)
+    cached = _VALIDATED_SCHEMA_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        dataset = cached.model_copy(deep=True)
+    else:
+        dataset = Dataset.model_validate(schema_dict)
+        if key is not None:
+            if len(_VALIDATED_SCHEMA_CACHE) >= _VALIDATED_SCHEMA_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _VALIDATED_SCHEMA_CACHE[next(iter(_VALIDATED_SCHEMA_CACHE))]
+            _VALIDATED_SCHEMA_CACHE[key] = dataset.model_copy(deep=True)
 
     # Step 2: Preflight validation to catch runtime errors
     from .preflight import preflight_validate
 
-    preflight_validate(dataset)
+    preflight_validate(dataset, schema_key=key)
 
     return dataset
@@ -1,13 +1,44 @@
 """Deterministic seed derivation for reproducibility."""
 
 import hashlib
+import struct
 import numpy as np
-from typing import Union
-
-
+from functools import lru_cache
+from typing import Tuple, Union
+
+
+def _hash_parts(parts: Tuple[Union[str, int, float], ...]) -> int:
+    """Hash seed parts to a 32-bit seed (uncached core of derive_seed)."""
+    # Feed each part to the hash as a type tag plus a length-prefixed binary
+    # encoding, so distinct part lists never collide and ints/floats skip str()
+    hasher = hashlib.blake2b(digest_size=4)
+    for part in parts:
+        if isinstance(part, str):
+            tag, data = b"s", part.encode("utf-8")
+        elif isinstance(part, bool):
+            tag, data = b"b", b"\x01" if part else b"\x00"
+        elif isinstance(part, (int, np.integer)):
+            part = int(part)
+            tag, data = b"i", part.to_bytes(part.bit_length() // 8 + 1, byteorder="big", signed=True)
+        elif isinstance(part, (float, np.floating)):
+            tag, data = b"f", struct.pack(">d", float(part))
+        else:
+            tag, data = b"r", str(part).encode("utf-8")
+        hasher.update(tag)
+        hasher.update(len(data).to_bytes(4, byteorder="big"))
+        hasher.update(data)
+
+    # A 4-byte digest is already in numpy's valid seed range (0 to 2^32-1)
+    return int.from_bytes(hasher.digest(), byteorder="big", signed=False)
+
+
+# typed=True keeps 1, 1.0 and True apart, since they are encoded differently
+@lru_cache(maxsize=4096, typed=True)
 def derive_seed(*parts: Union[str, int, float]) -> int:
     """
-    Derive a deterministic seed from input parts using SHA256.
+    Derive a deterministic seed from input parts using BLAKE2b.
+
+    Results are memoized, so repeated node/column/parent scopes hash once.
 
     Args:
         *parts: Components to hash (master_seed, node_id, column_name, etc.)
@@ -22,19 +53,7 @@ def derive_seed(*parts: Union[str, int, float]) -> int:
         >>> derive_seed(42, "order", "customer_id", "parent_123")
         987654321
     """
-    # Convert all parts to strings and concatenate
-    combined = "|".join(str(p) for p in parts)
-
-    # Hash using SHA256
-    hash_bytes = hashlib.sha256(combined.encode("utf-8")).digest()
-
-    # Take first 4 bytes and convert to int32
-    seed = int.from_bytes(hash_bytes[:4], byteorder="big", signed=False)
-
-    # Ensure it's within valid range for numpy (0 to 2^32-1)
-    seed = seed % (2**32)
-
-    return seed
+    return _hash_parts(parts)
 
 
 def get_rng(*parts: Union[str, int, float]) -> np.random.Generator:
@@ -87,10 +106,11 @@ class SeedManager:
 
     def row_seed(self, node_id: str, parent_pk: Union[str, int], row_index: int) -> int:
         """Derive seed for a specific child row."""
-        return derive_seed(self.master_seed, node_id, "parent", parent_pk, "row", row_index)
+        # Row scopes are rarely repeated, so bypass the derive_seed cache
+        return _hash_parts((self.master_seed, node_id, "parent", parent_pk, "row", row_index))
 
     def row_rng(
         self, node_id: str, parent_pk: Union[str, int], row_index: int
     ) -> np.random.Generator:
         """Get RNG for a specific child row."""
-        return get_rng(self.master_seed, node_id, "parent", parent_pk, "row", row_index)
+        return np.random.default_rng(self.row_seed(node_id, parent_pk, row_index))
@@ -13,6 +13,8 @@ import pandas as pd
 from typing import Dict, List, Optional
 import logging
 
+from datagen.core.jit import HAS_NUMBA, njit, prange
+
 logger = logging.getLogger(__name__)
 
 
@@ -58,47 +60,55 @@ def calculate_stage_progression(
         raise ValueError("stage_config must have 'stages' list")
 
     segment_variation = stage_config.get("segment_variation", {})
-
     n_parents = len(parent_df)
-    results = []
-
-    for parent_idx in range(n_parents):
-        # Get segment if available
-        segment = None
-        if parent_segment_col and parent_segment_col in parent_df.columns:
-            segment = parent_df.iloc[parent_idx][parent_segment_col]
-
-        # Get transition multiplier for this segment
-        transition_multiplier = 1.0
-        if segment and segment in segment_variation:
-            transition_multiplier = segment_variation[segment].get("transition_multiplier", 1.0)
-
-        # Simulate progression through stages
-        current_stage_index = 0
-        for stage_idx, stage in enumerate(stages):
-            # First stage always reached (transition_rate=1.0 for signup/start)
-            if stage_idx == 0:
-                current_stage_index = 0
-                continue
-
-            # Calculate effective transition rate
-            base_rate = stage["transition_rate"]
-            effective_rate = min(1.0, base_rate * transition_multiplier)
-
-            # Roll dice to see if transition happens
-            if rng.random() < effective_rate:
-                current_stage_index = stage_idx
+
+    # Transition multiplier per parent from its segment (1.0 when unsegmented):
+    # factorize the segment column and gather from a per-category lookup array
+    transition_multiplier = np.ones(n_parents)
+    if parent_segment_col and parent_segment_col in parent_df.columns and segment_variation:
+        codes, segments = pd.factorize(parent_df[parent_segment_col])
+        lookup = np.ones(len(segments) + 1)  # trailing slot serves code -1 (missing)
+        for code, segment in enumerate(segments):
+            if segment and segment in segment_variation:
+                lookup[code] = segment_variation[segment].get("transition_multiplier", 1.0)
+        transition_multiplier = lookup[codes]
+
+    # Simulate every parent at once: a parent passes stage k if it passed all
+    # earlier stages and its draw falls under the effective rate. The first
+    # stage is always reached, so only transitions into stages 1..n are rolled.
+    base_rates = np.array([stage["transition_rate"] for stage in stages[1:]], dtype=float)
+    draws = rng.random((n_parents, len(base_rates)))
+    if HAS_NUMBA:
+        stage_index = _stage_index_nb(draws, base_rates, transition_multiplier)
+    else:
+        effective_rates = np.minimum(1.0, transition_multiplier[:, None] * base_rates[None, :])
+        passed = draws < effective_rates
+        stage_index = np.cumprod(passed, axis=1).sum(axis=1)
+
+    stage_names = np.array([stage["stage_name"] for stage in stages], dtype=object)
+    return pd.DataFrame({
+        "parent_index": np.arange(n_parents),
+        "stage_reached": stage_names[stage_index],
+        "stage_index": stage_index,
+    })
+
+
+@njit(parallel=True, cache=True)
+def _stage_index_nb(draws, base_rates, multipliers):
+    # Walk each parent's stages and stop at the first failed transition, so no
+    # pass/cumprod matrices are materialized. Draws lie in [0, 1), which makes
+    # capping the rate at 1.0 unnecessary.
+    n_parents, n_transitions = draws.shape
+    stage_index = np.zeros(n_parents, dtype=np.int64)
+    for i in prange(n_parents):
+        reached = 0
+        for j in range(n_transitions):
+            if draws[i, j] < multipliers[i] * base_rates[j]:
+                reached = j + 1
             else:
-                # Drop off - don't progress further
                 break
-
-        results.append({
-            "parent_index": parent_idx,
-            "stage_reached": stages[current_stage_index]["stage_name"],
-            "stage_index": current_stage_index
-        })
-
-    return pd.DataFrame(results)
+        stage_index[i] = reached
+    return stage_index
 
 
 def generate_stage_events(
@@ -134,49 +144,36 @@ def generate_stage_events(
         rng = np.random.default_rng()
 
     stages = stage_config.get("stages", [])
-    records = []
-    event_id = pk_start
-
-    for _, row in stage_progression.iterrows():
-        parent_idx = row["parent_index"]
-        final_stage_index = row["stage_index"]
-
-        # Track cumulative timestamp for this parent entity
-        current_timestamp = None
-        if timestamp_col and timestamp_col in parent_df.columns:
-            parent_timestamp = parent_df.iloc[parent_idx][timestamp_col]
-            current_timestamp = parent_timestamp
-
-        # Generate events for all stages reached (including final one)
-        for stage_idx in range(final_stage_index + 1):
-            stage_name = stages[stage_idx]["stage_name"]
-
-            # Calculate timestamp if parent has timestamp column
-            timestamp = None
-            if current_timestamp is not None:
-                if stage_idx == 0:
-                    # First stage happens at parent timestamp
-                    timestamp = current_timestamp
-                else:
-                    # Add random time since previous stage (ensures monotonic increase)
-                    hours_since_prev = rng.exponential(time_between_stages_hours)
-                    timestamp = current_timestamp + pd.Timedelta(hours=hours_since_prev)
-                    current_timestamp = timestamp  # Update for next stage
-
-            record = {
-                "event_id": event_id,
-                "parent_index": parent_idx,
-                "stage_name": stage_name,
-                "stage_index": stage_idx
-            }
 
-            if timestamp is not None:
-                record["timestamp"] = timestamp
+    # Expand each parent into one row per stage reached (stage 0..final)
+    parent_index = stage_progression["parent_index"].to_numpy()
+    counts = stage_progression["stage_index"].to_numpy() + 1
+    parent_rep = np.repeat(parent_index, counts)
+    block_start = np.repeat(np.cumsum(counts) - counts, counts)
+    stage_idx = np.arange(counts.sum()) - block_start
+
+    stage_names = np.array([stage["stage_name"] for stage in stages], dtype=object)
+    events = {
+        "event_id": np.arange(pk_start, pk_start + len(stage_idx)),
+        "parent_index": parent_rep,
+        "stage_name": stage_names[stage_idx],
+        "stage_index": stage_idx,
+    }
+
+    if timestamp_col and timestamp_col in parent_df.columns:
+        # First stage happens at the parent timestamp; each later stage adds an
+        # exponential gap to the previous stage's offset (ensures monotonic increase)
+        later = stage_idx > 0
+        offsets = np.zeros(len(stage_idx))
+        offsets[later] = rng.exponential(time_between_stages_hours, size=int(later.sum()))
+        for level in range(1, int(counts.max(initial=1))):
+            rows = np.flatnonzero(stage_idx == level)
+            offsets[rows] += offsets[rows - 1]
 
-            records.append(record)
-            event_id += 1
+        parent_timestamps = parent_df[timestamp_col].iloc[parent_rep].reset_index(drop=True)
+        events["timestamp"] = parent_timestamps + pd.to_timedelta(offsets, unit="h")
 
-    return pd.DataFrame(records)
+    return pd.DataFrame(events)
 
 
 def get_stage_statistics(stage_progression: pd.DataFrame, stage_config: dict) -> Dict:
@@ -196,17 +193,18 @@ def get_stage_statistics(stage_progression: pd.DataFrame, stage_config: dict) ->
     """
     stages = stage_config.get("stages", [])
     total = len(stage_progression)
-
-    stage_counts = {}
-    for stage in stages:
-        count = (stage_progression["stage_reached"] == stage["stage_name"]).sum()
-        stage_counts[stage["stage_name"]] = int(count)
-
-    # Calculate cumulative counts (entities reaching at least this stage)
-    cumulative_counts = {}
-    for stage_idx, stage in enumerate(stages):
-        count = (stage_progression["stage_index"] >= stage_idx).sum()
-        cumulative_counts[stage["stage_name"]] = int(count)
+    stage_names = [stage["stage_name"] for stage in stages]
+
+    reached = stage_progression["stage_reached"].value_counts()
+    stage_counts = {name: int(reached.get(name, 0)) for name in stage_names}
+
+    # Entities reaching at least each stage: reverse cumulative sum of the
+    # per-index counts (indices past the last stage count toward every stage)
+    by_index = np.bincount(
+        stage_progression["stage_index"].to_numpy(dtype=np.int64), minlength=len(stages)
+    )
+    at_least = by_index[::-1].cumsum()[::-1]
+    cumulative_counts = {name: int(at_least[i]) for i, name in enumerate(stage_names)}
 
     # Calculate rates
     stage_rates = {}
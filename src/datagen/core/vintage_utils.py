@@ -3,63 +3,80 @@
 Provides helpers for calculating entity age and evaluating age-based curves.
 """
 
+from datetime import datetime
+from functools import lru_cache
 import numpy as np
 import pandas as pd
-from typing import Union, List
+from typing import Callable, List, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+_NS_PER_DAY = 86_400_000_000_000
+# Days per supported age unit (months and years are approximated as 30 and 365 days)
+_DAYS_PER_UNIT = {"day": 1, "month": 30.0, "year": 365.0}
+_NAT_NS = np.iinfo(np.int64).min  # int64 view of NaT
+
+
+def _to_naive_ns(times) -> Union[np.ndarray, np.int64]:
+    """Drop any timezone (keeping local wall time) and return int64 nanoseconds (NaT is _NAT_NS)."""
+    if isinstance(times, (pd.Timestamp, datetime)):
+        ts = pd.Timestamp(times)
+        if ts.tz is not None:
+            ts = ts.tz_localize(None)
+        return np.int64(ts.as_unit("ns").value)
+
+    idx = pd.DatetimeIndex(times)
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    return idx.as_unit("ns").asi8
+
+
 def calculate_entity_ages(
-    entity_created_at: pd.Series, reference_time: pd.Series, time_unit: str = "day"
+    entity_created_at: pd.Series,
+    reference_time: Union[pd.Series, pd.Timestamp],
+    time_unit: str = "day",
 ) -> np.ndarray:
     """
     Calculate entity ages in specified time units.
 
     Args:
         entity_created_at: Timestamp when each entity was created
-        reference_time: Reference timestamp (e.g., fact timestamp)
+        reference_time: Reference timestamp (e.g., fact timestamp), per entity or a single
+            Timestamp shared by all entities
         time_unit: Unit for age calculation ("day", "month", "year")
 
     Returns:
-        Array of ages in specified time units
+        Array of ages in specified time units, counted from whole elapsed days
+        (NaN where either timestamp is missing)
 
     Examples:
         >>> entity_created = pd.to_datetime(["2024-01-01", "2024-02-01"])
         >>> fact_time = pd.to_datetime(["2024-03-01", "2024-04-01"])
         >>> calculate_entity_ages(entity_created, fact_time, "month")
-        array([2, 2])  # 2 months old, 2 months old
+        array([2., 2.])  # 2 months old, 2 months old
     """
-    # Normalize timezones - convert both to tz-naive to avoid mismatch errors
-    # Handle both Series (with .dt accessor) and DatetimeIndex
-    if hasattr(entity_created_at, "dt") and entity_created_at.dt.tz is not None:
-        entity_created_at = entity_created_at.dt.tz_localize(None)
-    elif hasattr(entity_created_at, "tz") and entity_created_at.tz is not None:
-        entity_created_at = entity_created_at.tz_localize(None)
-
-    if hasattr(reference_time, "dt") and reference_time.dt.tz is not None:
-        reference_time = reference_time.dt.tz_localize(None)
-    elif hasattr(reference_time, "tz") and reference_time.tz is not None:
-        reference_time = reference_time.tz_localize(None)
-
-    # Calculate age in days first
-    # When subtracting DatetimeIndex, we get TimedeltaIndex, not Series
-    timedelta = reference_time - entity_created_at
-    age_days = timedelta.days.values if hasattr(timedelta, "days") else timedelta.dt.days.values
+    days_per_unit = _DAYS_PER_UNIT.get(time_unit)
+    if days_per_unit is None:
+        raise ValueError(f"Unknown time_unit: {time_unit}. Expected 'day', 'month', or 'year'")
+
+    # Timezones are dropped, so ages are measured in local wall-clock time
+    created_ns = _to_naive_ns(entity_created_at)
+    reference_ns = _to_naive_ns(reference_time)
+
+    # Whole elapsed days, floored like Timedelta.days
+    age_days = (reference_ns - created_ns) // _NS_PER_DAY
+    missing = (created_ns == _NAT_NS) | (reference_ns == _NAT_NS)
+    if np.any(missing):
+        age_days = np.where(missing, np.nan, age_days)
 
     # Ensure non-negative ages (entities can't be used before they're created)
     age_days = np.maximum(0, age_days)
 
-    # Convert to requested time unit
     if time_unit == "day":
         return age_days
-    elif time_unit == "month":
-        return age_days / 30.0  # Approximate month as 30 days
-    elif time_unit == "year":
-        return age_days / 365.0  # Approximate year as 365 days
-    else:
-        raise ValueError(f"Unknown time_unit: {time_unit}. Expected 'day', 'month', or 'year'")
+    return age_days / days_per_unit
 
 
 def evaluate_curve(ages: np.ndarray, curve_spec: Union[List[float], dict]) -> np.ndarray:
@@ -117,16 +134,52 @@ def _evaluate_array_curve(ages: np.ndarray, curve: List[float]) -> np.ndarray:
     if not curve:
         raise ValueError("Array curve cannot be empty")
 
-    # Round ages to nearest integer for binning
-    age_bins = np.round(ages).astype(int)
+    curve_arr = np.asarray(curve, dtype=np.float64)
 
-    # Clamp to valid indices (0 to len(curve)-1)
-    age_bins = np.clip(age_bins, 0, len(curve) - 1)
+    # Round ages to nearest integer bin and clamp to valid indices (0 to len(curve)-1)
+    age_bins = np.clip(np.rint(ages).astype(np.intp), 0, curve_arr.size - 1)
 
-    # Lookup multipliers
-    multipliers = np.array([curve[idx] for idx in age_bins])
+    # Lookup multipliers with a single gather
+    return curve_arr[age_bins]
 
-    return multipliers
+
+@lru_cache(maxsize=256)
+def _compile_parametric_curve(
+    curve_type: str, a: float, b: float
+) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build (and memoize) the vectorized evaluator for one parametric curve.
+
+    Args:
+        curve_type: "logarithmic", "exponential", or "linear"
+        a: Curve parameter a
+        b: Curve parameter b
+
+    Returns:
+        Function mapping an ages array to raw (unclamped) multipliers
+    """
+    if curve_type == "logarithmic":
+        # multiplier = a + b * log(age + 1); log1p avoids log(0) in one pass
+        def curve(ages: np.ndarray) -> np.ndarray:
+            return a + b * np.log1p(ages)
+
+    elif curve_type == "exponential":
+        # multiplier = a * exp(b * age)
+        def curve(ages: np.ndarray) -> np.ndarray:
+            return a * np.exp(b * ages)
+
+    elif curve_type == "linear":
+        # multiplier = a + b * age
+        def curve(ages: np.ndarray) -> np.ndarray:
+            return a + b * ages
+
+    else:
+        raise ValueError(
+            f"Unknown curve_type: {curve_type}. "
+            f"Expected 'logarithmic', 'exponential', or 'linear'"
+        )
+
+    return curve
 
 
 def _evaluate_parametric_curve(ages: np.ndarray, spec: dict) -> np.ndarray:
@@ -159,24 +212,7 @@ def _evaluate_parametric_curve(ages: np.ndarray, spec: dict) -> np.ndarray:
     if a is None or b is None:
         raise ValueError("Parametric curve params must include 'a' and 'b'")
 
-    if curve_type == "logarithmic":
-        # multiplier = a + b * log(age + 1)
-        # Adding 1 to avoid log(0)
-        multipliers = a + b * np.log(ages + 1)
-
-    elif curve_type == "exponential":
-        # multiplier = a * exp(b * age)
-        multipliers = a * np.exp(b * ages)
-
-    elif curve_type == "linear":
-        # multiplier = a + b * age
-        multipliers = a + b * ages
-
-    else:
-        raise ValueError(
-            f"Unknown curve_type: {curve_type}. "
-            f"Expected 'logarithmic', 'exponential', or 'linear'"
-        )
+    multipliers = _compile_parametric_curve(curve_type, a, b)(ages)
 
     # Ensure multipliers are non-negative (activity/value can't be negative)
     multipliers = np.maximum(0, multipliers)
@@ -184,6 +220,23 @@ def _evaluate_parametric_curve(ages: np.ndarray, spec: dict) -> np.ndarray:
     return multipliers
 
 
+def _combined_multiplier(entity_ages: np.ndarray, curves) -> np.ndarray:
+    """
+    Evaluate curves at entity ages and multiply them into one multiplier vector.
+
+    Args:
+        entity_ages: Age of each entity in time units
+        curves: Iterable of curve specs (array-based or parametric)
+
+    Returns:
+        Elementwise product of all curve multipliers (ones if no curves)
+    """
+    combined = np.ones(len(entity_ages), dtype=np.float64)
+    for curve in curves:
+        combined *= evaluate_curve(entity_ages, curve)
+    return combined
+
+
 def apply_vintage_multipliers_to_fanout(
     fanout_counts: np.ndarray, entity_ages: np.ndarray, vintage_config: dict
 ) -> np.ndarray:
@@ -207,33 +260,51 @@ def apply_vintage_multipliers_to_fanout(
     age_based_multipliers = vintage_config.get("age_based_multipliers", {})
 
     # Look for fanout-applicable multipliers
-    result_counts = fanout_counts.copy().astype(float)
-
+    curves = {}
     for multiplier_name, multiplier_spec in age_based_multipliers.items():
-        applies_to = multiplier_spec.get("applies_to")
-
         # Check if this multiplier applies to fanout
-        if applies_to == "fanout":
+        if multiplier_spec.get("applies_to") == "fanout":
             curve = multiplier_spec.get("curve")
             if not curve:
                 logger.warning(
                     f"Multiplier '{multiplier_name}' has applies_to='fanout' but no curve defined"
                 )
                 continue
+            curves[multiplier_name] = curve
 
-            # Evaluate curve at entity ages
-            multipliers = evaluate_curve(entity_ages, curve)
+    # Apply all curves in a single multiply, reusing the combined buffer for the result
+    result_counts = _combined_multiplier(entity_ages, curves.values())
+    result_counts *= fanout_counts
 
-            # Apply multipliers
-            result_counts *= multipliers
+    if curves:
+        logger.debug(
+            f"  Applied vintage multipliers {list(curves)} to fanout: "
+            f"mean changed from {fanout_counts.mean():.2f} to {result_counts.mean():.2f}"
+        )
 
-            logger.debug(
-                f"  Applied vintage multiplier '{multiplier_name}' to fanout: "
-                f"mean changed from {fanout_counts.mean():.2f} to {result_counts.mean():.2f}"
-            )
+    # Round and convert to int, ensuring non-negative (in place until the final cast)
+    np.rint(result_counts, out=result_counts)
+    np.maximum(result_counts, 0, out=result_counts)
+    return result_counts.astype(int)
 
-    # Round and convert to int, ensuring non-negative
-    return np.maximum(0, np.round(result_counts)).astype(int)
+
+def _applies_to_column(applies_to, column_name: str) -> bool:
+    """
+    Check whether a multiplier's applies_to targets a column.
+
+    applies_to can be:
+    - "fanout" (never applies to column values)
+    - "all" (applies to all columns)
+    - ["column1", "column2"] (list of column names)
+    - "column1" (single column name)
+    """
+    if applies_to == "fanout":
+        return False
+    if applies_to == "all":
+        return True
+    if isinstance(applies_to, list):
+        return column_name in applies_to
+    return isinstance(applies_to, str) and applies_to == column_name
 
 
 def apply_vintage_multipliers_to_values(
@@ -258,47 +329,34 @@ def apply_vintage_multipliers_to_values(
         return values
 
     age_based_multipliers = vintage_config.get("age_based_multipliers", {})
+    relevant = [
+        (multiplier_name, multiplier_spec)
+        for multiplier_name, multiplier_spec in age_based_multipliers.items()
+        if _applies_to_column(multiplier_spec.get("applies_to"), column_name)
+    ]
+
+    # Most columns have no vintage rule; skip the float copy entirely for them
+    if not relevant:
+        return values
 
-    result_values = values.copy().astype(float)
-
-    for multiplier_name, multiplier_spec in age_based_multipliers.items():
-        applies_to = multiplier_spec.get("applies_to")
-
-        # Check if this multiplier applies to this column
-        # applies_to can be:
-        # - "fanout" (skip for values)
-        # - "all" (apply to all columns)
-        # - ["column1", "column2"] (list of column names)
-        # - "column1" (single column name)
-
-        if applies_to == "fanout":
-            continue  # Skip fanout multipliers for column values
-
-        should_apply = False
-        if applies_to == "all":
-            should_apply = True
-        elif isinstance(applies_to, list) and column_name in applies_to:
-            should_apply = True
-        elif isinstance(applies_to, str) and applies_to == column_name:
-            should_apply = True
-
-        if should_apply:
-            curve = multiplier_spec.get("curve")
-            if not curve:
-                logger.warning(
-                    f"Multiplier '{multiplier_name}' applies to '{column_name}' but no curve defined"
-                )
-                continue
-
-            # Evaluate curve at entity ages
-            multipliers = evaluate_curve(entity_ages, curve)
+    curves = {}
+    for multiplier_name, multiplier_spec in relevant:
+        curve = multiplier_spec.get("curve")
+        if not curve:
+            logger.warning(
+                f"Multiplier '{multiplier_name}' applies to '{column_name}' but no curve defined"
+            )
+            continue
+        curves[multiplier_name] = curve
 
-            # Apply multipliers
-            result_values *= multipliers
+    # Apply all curves in a single multiply
+    combined = _combined_multiplier(entity_ages, curves.values())
+    result_values = values.astype(np.float64, copy=False) * combined
 
-            logger.debug(
-                f"  Applied vintage multiplier '{multiplier_name}' to column '{column_name}': "
-                f"mean changed from {values.mean():.2f} to {result_values.mean():.2f}"
-            )
+    if curves:
+        logger.debug(
+            f"  Applied vintage multipliers {list(curves)} to column '{column_name}': "
+            f"mean changed from {values.mean():.2f} to {result_values.mean():.2f}"
+        )
 
     return result_values
@@ -10,6 +10,7 @@ from datagen.core.generators.primitives import (
     generate_distribution,
     generate_zipf_weights,
     sample_fanout,
+    AliasSampler,
 )
 from datagen.core.generators.temporal import (
     generate_datetime_series,
@@ -76,6 +77,19 @@ def test_generate_zipf_weights():
     assert weights[0] == max(weights)
 
 
+def test_alias_sampler_matches_weights():
+    """Test alias sampler reproduces the target distribution."""
+    rng = np.random.default_rng(42)
+    weights = [0.5, 0.3, 0.2, 0.0]
+    sampler = AliasSampler(weights)
+
+    indices = sampler.sample(20000, rng)
+    freqs = np.bincount(indices, minlength=4) / 20000
+
+    assert np.allclose(freqs, weights, atol=0.02)
+    assert freqs[3] == 0.0  # Zero-weight items are never drawn
+
+
 def test_generate_distribution_normal():
     """Test normal distribution."""
     rng = np.random.default_rng(42)
@@ -208,6 +222,21 @@ def test_generate_faker_basic():
     assert all(isinstance(n, str) and len(n) > 0 for n in names)
 
 
+def test_generate_faker_dtype_hints():
+    """Test bounded-width Faker methods come back as pre-typed arrays."""
+    rng = np.random.default_rng(42)
+
+    ips = generate_faker("ipv4", 5, rng)
+    codes = generate_faker("country_code", 5, rng)
+    flags = generate_faker("boolean", 5, rng)
+
+    assert ips.dtype == np.dtype("<U15")
+    assert all(ip.count(".") == 3 for ip in ips)
+    assert codes.dtype == np.dtype("<U2")
+    assert all(len(c) == 2 for c in codes)
+    assert flags.dtype == np.bool_
+
+
 def test_generate_faker_with_locale():
     """Test Faker with specific locale."""
     rng = np.random.default_rng(42)
@@ -229,6 +258,17 @@ def test_generate_faker_locale_from_values():
     assert len(names) == 3
 
 
+def test_generate_faker_locale_from_values_deterministic():
+    """Test per-locale batching is reproducible and keeps row order."""
+    countries = np.array(["US", "DE", "US", "Prague", "CZ", "DE"])
+
+    first = generate_faker("name", 6, np.random.default_rng(7), locale_from_values=countries)
+    second = generate_faker("name", 6, np.random.default_rng(7), locale_from_values=countries)
+
+    assert list(first) == list(second)
+    assert all(isinstance(n, str) and len(n) > 0 for n in first)
+
+
 # ============================================================================
 # Registry Tests
 # ============================================================================
@@ -249,6 +289,18 @@ def test_lookup_resolver():
     assert all(uid in [1, 2, 3] for uid in user_ids)
 
 
+def test_lookup_resolver_reregister_refreshes_columns():
+    """Test re-registering a table invalidates cached column arrays."""
+    resolver = LookupResolver()
+    resolver.register_table("user", pd.DataFrame({"user_id": [1, 2, 3]}))
+    resolver.lookup("user.user_id", 5, np.random.default_rng(42))
+
+    resolver.register_table("user", pd.DataFrame({"user_id": [7, 8]}))
+    user_ids = resolver.lookup("user.user_id", 20, np.random.default_rng(42))
+
+    assert set(user_ids) <= {7, 8}
+
+
 def test_lookup_resolver_with_join():
     """Test lookup with join condition."""
     resolver = LookupResolver()
@@ -314,6 +366,52 @@ def test_generator_registry_choice():
     assert all(v in ["a", "b", "c"] for v in result)
 
 
+def test_generator_registry_choice_cached_per_spec():
+    """Test registry reuses prepared choices across batches of the same spec."""
+    registry = GeneratorRegistry()
+    spec = {"choice": {"choices": ["a", "b", "c"], "weights_kind": "zipf@1.5"}}
+
+    first = registry.generate(spec, 50, np.random.default_rng(7))
+    second = registry.generate(spec, 50, np.random.default_rng(7))
+
+    assert len(registry._choice_cache) == 1
+    assert list(first) == list(second)
+    assert all(v in ["a", "b", "c"] for v in first)
+
+
+def test_generator_registry_choice_cache_bounded_and_fresh(monkeypatch):
+    """Test the choice cache evicts old specs and re-prepares specs mutated in place."""
+    from datagen.core.generators import registry as registry_module
+
+    monkeypatch.setattr(registry_module, "_CHOICE_CACHE_SIZE", 2)
+    registry = GeneratorRegistry()
+    rng = np.random.default_rng(0)
+
+    specs = [{"choice": {"choices": [i]}} for i in range(3)]
+    for spec in specs:
+        registry.generate(spec, 5, rng)
+    assert len(registry._choice_cache) == 2
+    assert id(specs[0]["choice"]) not in registry._choice_cache
+
+    spec = specs[2]
+    spec["choice"]["choices"].append(99)
+    spec["choice"]["weights"] = [0, 1]
+    assert set(registry.generate(spec, 20, rng)) == {99}
+
+
+@pytest.mark.parametrize("weights", [[1, 1], [1, 1, 1, 1]])
+def test_generator_registry_choice_weights_length_mismatch(weights):
+    """Test weights shorter or longer than choices are rejected."""
+    registry = GeneratorRegistry()
+    spec = {"choice": {"choices": ["a", "b", "c"], "weights": weights}}
+
+    with pytest.raises(ValueError, match="weights has"):
+        registry.generate(spec, 10, np.random.default_rng(42))
+
+    with pytest.raises(ValueError, match="weights has"):
+        generate_choice(["a", "b", "c"], 10, np.random.default_rng(42), weights=weights)
+
+
 def test_generator_registry_distribution():
     """Test registry with distribution generator."""
     registry = GeneratorRegistry()
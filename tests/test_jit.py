@@ -0,0 +1,105 @@
+"""Tests for optional Numba kernels (skipped when Numba is not installed)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("numba")
+
+from datagen.core.generators.primitives import _clip_nb
+from datagen.core.generators.temporal import get_seasonality_multiplier
+from datagen.core.modifiers import (
+    _match_effects,
+    _match_effects_nb,
+    apply_modifiers,
+    modify_add,
+    modify_clamp,
+    modify_jitter,
+    modify_multiply,
+    modify_seasonality,
+)
+from datagen.core.stage_utils import _stage_index_nb
+
+
+def test_clip_kernel_matches_numpy():
+    """Test JIT clamp matches np.clip, including NaN passthrough."""
+    values = np.array([-5.0, 0.5, 12.0, np.nan])
+    result = _clip_nb(values, 0.0, 10.0)
+    expected = np.clip(values, 0.0, 10.0)
+
+    assert np.array_equal(result, expected, equal_nan=True)
+
+
+def test_fused_arithmetic_modifiers_match_sequential():
+    """Test a fused multiply/jitter/add/clamp run matches step-by-step application."""
+    values = np.random.default_rng(0).normal(100, 20, 1000)
+    modifiers = [
+        {"transform": "multiply", "args": {"factor": 1.5}},
+        {"transform": "jitter", "args": {"std": 0.1, "mode": "mul"}},
+        {"transform": "add", "args": {"value": -10}},
+        {"transform": "jitter", "args": {"std": 5.0}},
+        {"transform": "clamp", "args": {"min": 0, "max": None}},
+    ]
+
+    fused = apply_modifiers(values, modifiers, np.random.default_rng(1))
+
+    rng = np.random.default_rng(1)
+    expected = modify_multiply(values, 1.5)
+    expected = modify_jitter(expected, rng, 0.1, "mul")
+    expected = modify_add(expected, -10)
+    expected = modify_jitter(expected, rng, 5.0)
+    expected = modify_clamp(expected, 0, None)
+
+    assert np.array_equal(fused, expected)
+
+
+def test_effect_interval_kernel_matches_merge():
+    """Test the sorted-interval effect kernel matches the merge-based matcher."""
+    rng = np.random.default_rng(0)
+    n, m = 500, 80
+    timestamps = pd.Series(pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 60 * 24, n), unit="h"))
+    timestamps[5] = pd.NaT
+    context = pd.DataFrame({"store": rng.integers(0, 10, n).astype(float)})
+    context.loc[3, "store"] = np.nan
+    start = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 50, m), unit="D")
+    effects = pd.DataFrame({
+        "store_id": rng.integers(0, 12, m),
+        "start": start,
+        "end": start + pd.to_timedelta(rng.integers(0, 10, m), unit="D"),
+        "lift": rng.random(m),
+    })
+
+    for on in [{"store": "store_id"}, {}]:
+        expected = _match_effects(timestamps, context, effects, on, "start", "end", "lift")
+        result = _match_effects_nb(timestamps, context, effects, on, "start", "end", "lift")
+
+        assert np.array_equal(result[0], expected[0])
+        assert np.array_equal(result[1], expected[1])
+
+
+@pytest.mark.parametrize("dimension,n_weights", [("hour", 24), ("dow", 7), ("month", 12)])
+def test_seasonality_kernel_matches_pandas(dimension, n_weights):
+    """Test int64 calendar extraction matches the pandas .dt accessors."""
+    rng = np.random.default_rng(0)
+    ns = rng.integers(-2 * 10**18, 3 * 10**18, 5000)
+    timestamps = pd.Series(pd.to_datetime(ns))
+    values = rng.normal(100, 10, 5000)
+    weights = rng.uniform(0.5, 1.5, n_weights)
+
+    result = modify_seasonality(values, timestamps, dimension, list(weights))
+    expected = values * get_seasonality_multiplier(timestamps, dimension, list(weights))
+
+    assert np.array_equal(result, expected)
+
+
+def test_stage_index_kernel_matches_cumprod():
+    """Test the early-exit stage kernel matches the NumPy pass-matrix path."""
+    rng = np.random.default_rng(3)
+    draws = rng.random((2000, 3))
+    base_rates = np.array([0.7, 0.5, 0.9])
+    multipliers = rng.choice([0.5, 1.0, 1.6], 2000)
+
+    passed = draws < np.minimum(1.0, multipliers[:, None] * base_rates[None, :])
+    expected = np.cumprod(passed, axis=1).sum(axis=1)
+
+    assert np.array_equal(_stage_index_nb(draws, base_rates, multipliers), expected)
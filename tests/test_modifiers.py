@@ -145,6 +145,21 @@ class TestTrendModifier:
         assert result[0] < result.iloc[-1]
         assert result[0] == pytest.approx(50.0, rel=0.01)
 
+    def test_exponential_trend_with_nat(self):
+        """Test exponential trend keeps the Series name and yields NaN for NaT rows."""
+        timestamps = pd.Series(pd.date_range("2020-01-01", periods=1000, freq="D"), name="ts")
+        timestamps[10] = pd.NaT
+        values = np.random.default_rng(0).normal(100, 10, 1000)
+
+        result = modify_trend(values, timestamps, "exponential", 0.08)
+
+        years = (timestamps - timestamps.min()).dt.total_seconds() / (365.25 * 86400)
+        expected = values * np.power(1.08, years.to_numpy())
+
+        assert isinstance(result, pd.Series) and result.name == "ts"
+        assert np.allclose(result, expected, rtol=1e-12, equal_nan=True)
+        assert np.isnan(result[10])
+
     def test_invalid_trend_type(self):
         """Test that invalid trend type raises error."""
         dates = pd.date_range("2024-01-01", periods=5, freq="ME")
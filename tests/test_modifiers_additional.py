@@ -14,8 +14,13 @@ from datagen.core.modifiers import (
     modify_map_values,
     modify_seasonality,
     modify_outliers,
-    apply_modifiers
+    modify_effect,
+    apply_modifiers,
+    add_effect_window_ns,
+    _match_effects,
+    _match_effects_nb,
 )
+from datagen.core.jit import HAS_NUMBA
 
 
 class TestBasicArithmeticModifiers:
@@ -145,6 +150,20 @@ class TestNoiseModifiers:
         original_series = pd.Series(timestamps)
         assert not result_series.equals(original_series)
 
+    def test_modify_time_jitter_datetime64_array(self):
+        """Test datetime64 arrays are jittered on int64 nanoseconds and keep NaT."""
+        rng = np.random.default_rng(42)
+        timestamps = np.array(["2024-01-01T12:00", "NaT"], dtype="datetime64[s]")
+
+        result = modify_time_jitter(timestamps, rng, std_minutes=30.0)
+
+        assert isinstance(result, pd.DatetimeIndex)
+        assert result.dtype == np.dtype("datetime64[ns]")
+        assert result[1] is pd.NaT
+        delta_minutes = (result[0] - np.datetime64("2024-01-01T12:00")) / np.timedelta64(1, "m")
+        assert delta_minutes != 0
+        assert abs(delta_minutes) < 30 * 5
+
 
 class TestCategoricalModifiers:
     """Tests for map_values modifier."""
@@ -179,6 +198,34 @@ class TestCategoricalModifiers:
         expected = np.array([10, 20, 30, 10, 20])
         assert np.array_equal(result, expected)
 
+    def test_modify_map_values_longer_strings(self):
+        """Test mapped strings are not truncated to the input width."""
+        values = np.array(["A", "B", "C"])
+        mapping = {"A": "Active", "B": "Blocked"}
+        result = modify_map_values(values, mapping)
+
+        assert list(result) == ["Active", "Blocked", "C"]
+
+    def test_modify_map_values_single_pass(self):
+        """Test each value is mapped once, not through chained keys."""
+        values = np.array([1, 2, 3])
+        result = modify_map_values(values, {1: 2, 2: 3})
+
+        assert list(result) == [2, 3, 3]
+
+
+    def test_modify_map_values_keeps_input_dtype(self):
+        """Test int and string columns keep their dtype whatever the mapped values are."""
+        ints = modify_map_values(np.array([1, 2, 3]), {1: 1.5, 2: 20.9})
+        assert ints.dtype == np.int64
+        assert list(ints) == [1, 20, 3]
+
+        strings = modify_map_values(np.array(["A", "B", "C"]), {"A": 1, "B": 2.5})
+        assert strings.dtype.kind == "U"
+        assert list(strings) == ["1", "2.5", "C"]
+
+        objects = modify_map_values(np.array(["A", "B"], dtype=object), {"A": 1, "B": 2})
+        assert objects.dtype == object
 
 class TestTemporalModifiers:
     """Tests for seasonality modifier."""
@@ -236,6 +283,126 @@ class TestTemporalModifiers:
         assert result[11] == pytest.approx(150.0, rel=0.01)
 
 
+class TestEffectModifier:
+    """Tests for effect modifier window/key matching."""
+
+    @staticmethod
+    def _context(effect_df):
+        context = pd.DataFrame({
+            "shop_id": [1, 1, 2, 3],
+            "order_time": pd.to_datetime(
+                ["2024-01-05", "2024-02-05", "2024-01-05", "2024-01-05"]
+            ),
+        })
+        context["_effect_promo"] = [effect_df] * len(context)
+        return context
+
+    def test_effect_with_join_keys_and_window(self):
+        """Test effects match on key and window, first match wins, default elsewhere."""
+        effect_df = pd.DataFrame({
+            "shop_id": [1, 1, 2],
+            "start_at": pd.to_datetime(["2024-01-01", "2024-01-01", "2024-03-01"]),
+            "end_at": pd.to_datetime(["2024-01-31", "2024-12-31", "2024-03-31"]),
+            "mult": [2.0, 3.0, 5.0],
+        })
+        values = np.full(4, 10.0)
+
+        result = modify_effect(
+            values,
+            self._context(effect_df),
+            "promo",
+            {"shop_id": "shop_id"},
+            {"start_col": "start_at", "end_col": "end_at"},
+            {"field": "mult", "op": "mul", "default": 1.0},
+        )
+
+        # Row 0 matches both shop 1 effects -> first (2.0); row 1 only the second (3.0);
+        # shop 2 is outside its window and shop 3 has no effect -> default
+        assert list(result) == [20.0, 30.0, 10.0, 10.0]
+
+    def test_effect_without_join_keys(self):
+        """Test effects without join keys apply by time window only."""
+        effect_df = pd.DataFrame({
+            "start_at": pd.to_datetime(["2024-02-01"]),
+            "end_at": pd.to_datetime(["2024-02-28"]),
+            "delta": [7.0],
+        })
+        values = np.zeros(4)
+
+        result = modify_effect(
+            values,
+            self._context(effect_df),
+            "promo",
+            {},
+            {"start_col": "start_at", "end_col": "end_at"},
+            {"field": "delta", "op": "add", "default": 0.0},
+        )
+
+        assert list(result) == [0.0, 7.0, 0.0, 0.0]
+
+    def test_effect_with_precomputed_window_ns(self):
+        """Test precomputed int64 window columns give the same effect result."""
+        effect_df = pd.DataFrame({
+            "shop_id": [1, 1, 2],
+            "start_at": pd.to_datetime(["2024-01-01", "2024-01-01", "2024-03-01"]),
+            "end_at": pd.to_datetime(["2024-01-31", "2024-12-31", "2024-03-31"]),
+            "mult": [2.0, 3.0, 5.0],
+        })
+        window = {"start_col": "start_at", "end_col": "end_at"}
+        prepared = add_effect_window_ns(effect_df, window)
+
+        assert list(prepared.columns[-2:]) == ["_start_at_ns", "_end_at_ns"]
+        assert "_start_at_ns" not in effect_df.columns
+        assert add_effect_window_ns(prepared, window) is prepared
+
+        result = modify_effect(
+            np.full(4, 10.0),
+            self._context(prepared),
+            "promo",
+            {"shop_id": "shop_id"},
+            window,
+            {"field": "mult", "op": "mul", "default": 1.0},
+        )
+        assert list(result) == [20.0, 30.0, 10.0, 10.0]
+
+    @pytest.mark.parametrize("matcher", [
+        _match_effects,
+        pytest.param(_match_effects_nb, marks=pytest.mark.skipif(not HAS_NUMBA, reason="numba not installed")),
+    ])
+    @pytest.mark.parametrize("starts,ends", [
+        # overlapping windows for shop 1: the first in table order wins
+        (["2024-01-01", "2024-01-01", "2024-01-03"], ["2024-12-31", "2024-01-31", "2024-02-10"]),
+        # touching windows: bounds are inclusive on both ends
+        (["2024-01-01", "2024-01-05", "2024-02-05"], ["2024-01-05", "2024-02-05", "2024-02-28"]),
+        # unsorted windows, one empty and one with a missing bound
+        (["2024-02-01", "2024-01-10", None], ["2024-02-28", "2024-01-01", "2024-12-31"]),
+    ])
+    def test_effect_matchers_agree_with_row_scan(self, matcher, starts, ends):
+        """Test every effect matcher picks the first covering window in table order."""
+        effect_df = pd.DataFrame({
+            "shop_id": [1, 1, 1],
+            "start_at": pd.to_datetime(starts),
+            "end_at": pd.to_datetime(ends),
+            "mult": [2.0, 3.0, 5.0],
+        })
+        context = self._context(effect_df)
+        timestamps = context["order_time"]
+
+        for on in [{"shop_id": "shop_id"}, {}]:
+            expected_rows, expected = [], []
+            for i, (shop, ts) in enumerate(zip(context["shop_id"], timestamps)):
+                for _, effect in effect_df.iterrows():
+                    key_match = not on or effect["shop_id"] == shop
+                    if key_match and effect["start_at"] <= ts <= effect["end_at"]:
+                        expected_rows.append(i)
+                        expected.append(effect["mult"])
+                        break
+
+            rows, matched = matcher(timestamps, context, effect_df, on, "start_at", "end_at", "mult")
+            assert list(rows) == expected_rows
+            assert list(matched) == expected
+
+
 class TestOutlierModifiers:
     """Tests for outliers modifier."""
 
@@ -437,3 +604,37 @@ class TestApplyModifiersIntegration:
         # Result: (10 * 2) + 5 = 25
         expected = np.array([25.0, 45.0, 65.0])
         assert np.allclose(result, expected)
+
+    def test_apply_modifiers_does_not_mutate_input(self):
+        """Test in-place modifier steps only touch apply_modifiers' own copy."""
+        rng = np.random.default_rng(42)
+        values = np.array([10.0, 20.0, 30.0])
+
+        modifiers = [
+            {"transform": "multiply", "args": {"factor": 2.0}},
+            {"transform": "jitter", "args": {"std": 1.0}},
+        ]
+
+        apply_modifiers(values, modifiers, rng, None)
+
+        assert list(values) == [10.0, 20.0, 30.0]
+
+    def test_apply_modifiers_int_values_with_float_factor(self):
+        """Test int columns are promoted rather than truncated by float factors."""
+        rng = np.random.default_rng(42)
+        values = np.array([1, 2, 3])
+
+        result = apply_modifiers(values, [{"transform": "multiply", "args": {"factor": 1.5}}], rng)
+
+        assert list(result) == [1.5, 3.0, 4.5]
+
+    def test_float32_input_keeps_float64_draws(self):
+        """Test float32 input draws the same float64 jitter as float64 input."""
+        values = np.random.default_rng(0).normal(100, 20, 100).astype(np.float32)
+        jitter = [{"transform": "jitter", "args": {"std": 1.0}}]
+
+        result = apply_modifiers(values, jitter, np.random.default_rng(1))
+        expected = values + np.random.default_rng(1).normal(0, 1.0, size=len(values))
+
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, expected)
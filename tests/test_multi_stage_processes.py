@@ -105,6 +105,33 @@ class TestStageProgression:
         assert result1["stage_reached"].equals(result2["stage_reached"])
         assert result1["stage_index"].equals(result2["stage_index"])
 
+    def test_stage_progression_segment_rates(self):
+        """Test simulated funnel rates follow per-segment effective rates."""
+        parent_df = pd.DataFrame({"segment": ["vip", "budget", "standard"] * 20000})
+
+        stage_config = {
+            "stages": [
+                {"stage_name": "signup", "transition_rate": 1.0},
+                {"stage_name": "activation", "transition_rate": 0.5},
+                {"stage_name": "purchase", "transition_rate": 0.8}
+            ],
+            "segment_variation": {
+                "vip": {"transition_multiplier": 1.5},
+                "budget": {"transition_multiplier": 0.5}
+            }
+        }
+
+        result = calculate_stage_progression(
+            parent_df, stage_config, parent_segment_col="segment", rng=np.random.default_rng(7)
+        )
+        reached_purchase = (result["stage_index"] == 2).groupby(parent_df["segment"]).mean()
+
+        # Effective rates are capped at 1.0: vip 0.75 * 1.0, budget 0.25 * 0.4, standard 0.5 * 0.8
+        assert reached_purchase["vip"] == pytest.approx(0.75, abs=0.02)
+        assert reached_purchase["budget"] == pytest.approx(0.10, abs=0.02)
+        assert reached_purchase["standard"] == pytest.approx(0.40, abs=0.02)
+        assert (result["stage_reached"] == np.array(["signup", "activation", "purchase"])[result["stage_index"]]).all()
+
 
 class TestStageEvents:
     """Tests for stage event generation."""
@@ -184,6 +211,40 @@ class TestStageEvents:
         # But no timestamp column
         assert "timestamp" not in events.columns
 
+    def test_generate_stage_events_expansion_order(self):
+        """Test events expand per parent in stage order with increasing timestamps."""
+        parent_df = pd.DataFrame({
+            "created_at": pd.to_datetime(["2024-01-01", "2024-02-01", "2024-03-01"])
+        })
+        stage_progression = pd.DataFrame({
+            "parent_index": [2, 0, 1],
+            "stage_reached": ["purchase", "signup", "activation"],
+            "stage_index": [2, 0, 1]
+        })
+        stage_config = {
+            "stages": [
+                {"stage_name": "signup", "transition_rate": 1.0},
+                {"stage_name": "activation", "transition_rate": 0.5},
+                {"stage_name": "purchase", "transition_rate": 0.8}
+            ]
+        }
+
+        events = generate_stage_events(
+            parent_df, stage_progression, stage_config, pk_start=10,
+            timestamp_col="created_at", rng=np.random.default_rng(0)
+        )
+
+        assert events["event_id"].tolist() == list(range(10, 16))
+        assert events["parent_index"].tolist() == [2, 2, 2, 0, 1, 1]
+        assert events["stage_index"].tolist() == [0, 1, 2, 0, 0, 1]
+        assert events["stage_name"].tolist() == ["signup", "activation", "purchase", "signup", "signup", "activation"]
+
+        # Each parent's first event is at its own timestamp, later ones strictly after
+        firsts = events[events["stage_index"] == 0]
+        assert (firsts["timestamp"].to_numpy() == parent_df["created_at"].to_numpy()[firsts["parent_index"]]).all()
+        assert events["timestamp"].iloc[0] < events["timestamp"].iloc[1] < events["timestamp"].iloc[2]
+        assert events["timestamp"].iloc[4] < events["timestamp"].iloc[5]
+
 
 class TestStageStatistics:
     """Tests for stage statistics calculation."""
@@ -1,19 +1,25 @@
 """Tests for output module (Parquet, CSV, metadata writing)."""
 
-import pytest
-import tempfile
-import pandas as pd
+import datetime
 import json
+import tempfile
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pytest
+
+from datagen.core import output
 from datagen.core.output import (
-    write_parquet,
-    read_parquet,
-    write_metadata,
+    flush,
     read_metadata,
+    read_parquet,
     write_csv,
+    write_enhanced_metadata,
+    write_metadata,
+    write_parquet,
+    write_parquet_async,
     write_table_metadata,
-    write_enhanced_metadata
 )
 
 
@@ -46,6 +52,78 @@ class TestParquetIO:
             assert list(df_read.columns) == ["id", "name", "age", "score"]
             assert df_read["name"].tolist() == ["Alice", "Bob", "Charlie", "David", "Eve"]
 
+    def test_write_parquet_uses_zstd_row_groups(self):
+        """Test Parquet files are zstd-compressed with bounded row groups."""
+        import pyarrow.parquet as pq
+
+        df = pd.DataFrame({"id": range(300_000), "status": ["active", "inactive", "pending"] * 100_000})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.parquet"
+            write_parquet(df, path)
+
+            meta = pq.ParquetFile(path).metadata
+            assert meta.num_row_groups == 3
+            assert meta.row_group(0).column(1).compression == "ZSTD"
+            assert meta.row_group(0).column(0).statistics.has_min_max
+            assert read_parquet(path).equals(df)
+
+    def test_write_parquet_keeps_arrow_backed_columns(self):
+        """Test ArrowDtype columns round-trip with their Arrow types."""
+        df = pd.DataFrame({
+            "id": pd.array([1, 2, None], dtype="int64[pyarrow]"),
+            "score": pd.array([0.5, None, 1.5], dtype="double[pyarrow]"),
+        })
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "arrow.parquet"
+            write_parquet(df, path)
+            result = read_parquet(path)
+
+            assert list(result.dtypes) == list(df.dtypes)
+            assert result.equals(df)
+
+    def test_write_parquet_async_and_flush(self):
+        """Test queued Parquet writes are complete after flush and errors surface."""
+        frames = {f"t{i}": pd.DataFrame({"id": range(i * 100)}) for i in range(1, 5)}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            writes = [
+                write_parquet_async(df, Path(tmpdir) / f"{name}.parquet")
+                for name, df in frames.items()
+            ]
+            flush(writes)
+
+            for name, df in frames.items():
+                assert read_parquet(Path(tmpdir) / f"{name}.parquet").equals(df)
+
+            bad = write_parquet_async(pd.DataFrame({"bad": [object()]}), Path(tmpdir) / "bad.parquet")
+            with pytest.raises(ValueError):
+                flush([bad])
+
+    def test_io_pool_created_on_first_use(self, monkeypatch):
+        """Test the IO pool is created lazily and then reused."""
+        monkeypatch.setattr(output, "_IO_POOL", None)
+        pool = output._io_pool()
+        try:
+            assert output._io_pool() is pool
+        finally:
+            pool.shutdown()
+
+    def test_flush_only_waits_on_own_writes(self):
+        """Test one caller's flush ignores another caller's failing write."""
+        df = pd.DataFrame({"id": range(10)})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bad = write_parquet_async(pd.DataFrame({"bad": [object()]}), Path(tmpdir) / "bad.parquet")
+            good = write_parquet_async(df, Path(tmpdir) / "good.parquet")
+
+            flush([good])
+            assert read_parquet(Path(tmpdir) / "good.parquet").equals(df)
+
+            with pytest.raises(ValueError):
+                flush([bad])
+
     def test_write_parquet_creates_directory(self):
         """Test that write_parquet creates parent directories."""
         df = pd.DataFrame({"col": [1, 2, 3]})
@@ -95,6 +173,42 @@ class TestMetadataIO:
             assert metadata_read["master_seed"] == 42
             assert metadata_read["tables"]["user"]["rows"] == 100
 
+    def test_write_metadata_numpy_values(self):
+        """Test NumPy scalars and arrays are written as plain JSON values."""
+        metadata = {"rows": np.int64(5), "mean": np.float64(1.5), "ids": np.array([1, 2]), "path": Path("a")}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "metadata.json"
+            write_metadata(metadata, path)
+
+            assert read_metadata(path) == {"rows": 5, "mean": 1.5, "ids": [1, 2], "path": "a"}
+
+    def test_write_metadata_same_with_and_without_orjson(self, monkeypatch):
+        """Test the orjson and json.dump paths write identical metadata files."""
+        pytest.importorskip("orjson")
+        metadata = {
+            "generated_at": datetime.datetime(2024, 1, 1, 12, 30),
+            "name": "Café",
+            "mean": float("nan"),
+            "stats": {
+                "ratio": np.float64(0.25),
+                "values": np.array([1.5, np.nan]),
+                "rows": np.int64(3),
+            },
+            "tags": ("a", None, True),
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fast_path = Path(tmpdir) / "fast.json"
+            write_metadata(metadata, fast_path)
+            monkeypatch.setattr(output, "orjson", None)
+            plain_path = Path(tmpdir) / "plain.json"
+            write_metadata(metadata, plain_path)
+
+            assert fast_path.read_bytes() == plain_path.read_bytes()
+            assert read_metadata(plain_path)["generated_at"] == "2024-01-01 12:30:00"
+            assert read_metadata(plain_path)["mean"] is None
+
     def test_write_metadata_creates_directory(self):
         """Test that write_metadata creates parent directories."""
         metadata = {"test": "data"}
@@ -158,6 +272,40 @@ class TestCSVIO:
             df_read = pd.read_csv(path, index_col=0)
             assert len(df_read) == 2
 
+    def test_write_csv_mixed_object_column(self):
+        """Test columns Arrow cannot convert still round-trip through CSV."""
+        df = pd.DataFrame({"id": [1, 2], "value": [1, "x"]})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.csv"
+            write_csv(df, path)
+
+            df_read = pd.read_csv(path)
+            assert df_read["value"].astype(str).tolist() == ["1", "x"]
+
+    def test_write_csv_matches_pandas_bytes(self):
+        """Test the Arrow CSV path writes exactly what df.to_csv writes."""
+        df = pd.DataFrame({
+            "id": [1, 2, 3],
+            "score": [1.0, 1e-05, np.nan],
+            "active": [True, False, True],
+            "name": ["Alice", "", None],
+            "day": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+            "created_at": pd.to_datetime(
+                ["2024-01-01 10:00:00.5", "2024-01-02 00:00:00.0", "2024-01-03 00:00:00.0"]
+            ),
+            "seen_at": pd.to_datetime(
+                ["2024-01-01 10:00", "2024-01-02 00:00", "2024-01-03 00:00"], utc=True
+            ),
+            "note, quoted": ["plain", 'has "quote"', "a,b"],
+        })
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.csv"
+            for frame in (df.drop(columns="note, quoted"), df):
+                write_csv(frame, path)
+                assert path.read_bytes() == frame.to_csv(index=False).encode("utf-8")
+
     def test_write_csv_creates_directory(self):
         """Test that write_csv creates parent directories."""
         df = pd.DataFrame({"col": [1, 2, 3]})
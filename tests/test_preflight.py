@@ -0,0 +1,104 @@
+"""Tests for preflight schema validation."""
+
+import pytest
+
+from datagen.core import preflight
+from datagen.core.preflight import PreflightValidator, _valid_faker_methods, preflight_validate
+from datagen.core.schema import Dataset
+
+
+def _dataset(columns, constraints=None):
+    """Build a one-table dataset with the given user columns."""
+    return Dataset.model_validate({
+        "version": "1.0",
+        "metadata": {"name": "test"},
+        "timeframe": {"start": "2024-01-01T00:00:00Z", "end": "2024-12-31T23:59:59Z", "freq": "D"},
+        "nodes": [
+            {
+                "id": "user",
+                "kind": "entity",
+                "pk": "user_id",
+                "columns": [
+                    {"name": "user_id", "type": "int", "generator": {"sequence": {"start": 1, "step": 1}}},
+                    *columns,
+                ],
+            }
+        ],
+        "constraints": constraints or {},
+    })
+
+
+def test_valid_faker_methods_cached():
+    """Test the Faker method catalog is built once and shared."""
+    assert _valid_faker_methods() is _valid_faker_methods()
+    assert "email" in _valid_faker_methods()
+
+
+def test_invalid_faker_method_reported():
+    """Test unknown Faker methods fail preflight with a suggestion."""
+    dataset = _dataset([{"name": "mail", "type": "string", "generator": {"faker": {"method": "emails"}}}])
+
+    validator = PreflightValidator(dataset)
+    assert not validator.validate_all()
+    assert len(validator.errors) == 1
+    assert "Invalid Faker method: 'emails'" in validator.errors[0].message
+    assert "Did you mean" in validator.errors[0].suggestion
+
+    with pytest.raises(ValueError, match="preflight validation failed"):
+        preflight_validate(dataset)
+
+
+def test_constraint_references_checked_against_valid_refs():
+    """Test well-formed references pass and broken ones name the missing part."""
+    dataset = _dataset(
+        [{"name": "age", "type": "int", "generator": {"sequence": {"start": 18, "step": 1}}}],
+        {"unique": ["user.user_id", "user.missing", "nope.age"]},
+    )
+
+    validator = PreflightValidator(dataset)
+    assert "user.age" in validator.valid_refs
+    assert not validator.validate_all()
+    messages = [e.message for e in validator.errors]
+    assert messages == [
+        "Unique constraint references non-existent column: 'user.missing'",
+        "Unique constraint references non-existent table: 'nope'",
+    ]
+
+
+def test_preflight_results_memoized(monkeypatch):
+    """Test outcomes are reused per schema key, including failures, and only with a key."""
+    good = _dataset([{"name": "mail", "type": "string", "generator": {"faker": {"method": "email"}}}])
+    bad = _dataset([{"name": "mail", "type": "string", "generator": {"faker": {"method": "emails"}}}])
+    assert preflight_validate(good, schema_key=b"good")
+    with pytest.raises(ValueError):
+        preflight_validate(bad, schema_key=b"bad")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validator should not run on a cache hit")
+
+    monkeypatch.setattr(preflight, "PreflightValidator", fail)
+    assert preflight_validate(good.model_copy(deep=True), schema_key=b"good")
+    with pytest.raises(ValueError, match="Invalid Faker method: 'emails'"):
+        preflight_validate(bad, schema_key=b"bad")
+    with pytest.raises(AssertionError, match="cache hit"):
+        preflight_validate(good)
+
+
+def test_fast_fail_stops_after_first_failing_pass():
+    """Test fast_fail skips passes after the first one that reports errors."""
+    dataset = _dataset(
+        [{"name": "mail", "type": "string", "generator": {"faker": {"method": "emails"}}}],
+        {"unique": ["user.missing"]},
+    )
+
+    full = PreflightValidator(dataset)
+    assert not full.validate_all()
+    assert len(full.errors) == 2
+
+    fast = PreflightValidator(dataset)
+    assert not fast.validate_all(fast_fail=True)
+    assert [e.location for e in fast.errors] == ["nodes.user.columns.mail.generator.faker.method"]
+
+    with pytest.raises(ValueError, match="emails") as excinfo:
+        preflight_validate(dataset, fast_fail=True)
+    assert "user.missing" not in str(excinfo.value)
@@ -196,6 +196,17 @@ def test_choice_requires_choices_or_ref():
         validate_schema(schema)
 
 
+def test_generator_spec_must_be_dict():
+    """Test a non-dict generator spec is rejected with a direct message."""
+    from datagen.core.schema import Column
+
+    with pytest.raises(ValidationError, match="choice must be a dict"):
+        Column.model_validate({"name": "status", "type": "string", "generator": {"choice": ["a", "b"]}})
+
+    with pytest.raises(ValidationError, match="step cannot be 0"):
+        Column.model_validate({"name": "id", "type": "int", "generator": {"sequence": {"step": 0}}})
+
+
 def test_duplicate_node_ids():
     """Test that duplicate node ids are rejected."""
     schema = {
@@ -243,3 +254,47 @@ def test_invalid_datetime():
 
     with pytest.raises(ValidationError, match="Invalid ISO8601 datetime"):
         validate_schema(schema)
+
+
+def test_timeframe_iso8601_validation():
+    """Test timeframe bounds accept ISO8601 dates/date-times and reject malformed ones."""
+    from datagen.core.schema import Timeframe
+
+    for value in ["2024-01-01", "2024-01-01T00:00:00Z", "2024-06-30 12:30", "2024-06-30T12:30:00.5+02:00",
+                  "2024-02-29", "2024-01-01T10", "20240101", "2024-01-01T00:00:00+05:30:15",
+                  "2024-01-01T10Z"]:
+        assert Timeframe(start=value, end=value, freq="D").start == value
+
+    for value in ["2024-13-01T00:00:00Z", "2024-01-01T24:00:00Z", "01/02/2024", "2024-01-01T00:00:00Zjunk",
+                  "2024-02-30", "2023-02-29T10:00:00", "2024-04-31T00:00:00Z"]:
+        with pytest.raises(ValidationError, match="Invalid ISO8601 datetime"):
+            Timeframe(start=value, end="2024-12-31", freq="D")
+
+
+def test_validate_schema_reuses_validated_dataset(monkeypatch):
+    """Test identical schema dicts skip structural re-validation but get fresh copies."""
+    schema = {
+        "version": "1.0",
+        "metadata": {"name": "cached"},
+        "timeframe": {"start": "2024-01-01T00:00:00Z", "end": "2024-12-31T23:59:59Z", "freq": "D"},
+        "nodes": [
+            {
+                "id": "user",
+                "kind": "entity",
+                "pk": "user_id",
+                "columns": [{"name": "user_id", "type": "int", "generator": {"sequence": {}}}]
+            }
+        ],
+        "constraints": {}
+    }
+    first = validate_schema(schema)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema should come from the cache")
+
+    monkeypatch.setattr(Dataset, "model_validate", fail)
+    second = validate_schema(dict(schema))
+
+    assert second == first
+    assert second is not first
+    assert second.nodes[0] is not first.nodes[0]
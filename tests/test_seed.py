@@ -113,3 +113,25 @@ def test_seed_manager_different_master_seeds():
     seed2 = sm2.node_seed("user")
 
     assert seed1 != seed2
+
+
+def test_derive_seed_cache_keeps_types_apart():
+    """Test memoized seeds distinguish equal-hashing parts of different types."""
+    assert derive_seed(1, "user") != derive_seed(1.0, "user")
+    assert derive_seed(1, "user") != derive_seed(True, "user")
+    assert derive_seed(1.0, "user") == derive_seed(1.0, "user")
+
+
+def test_row_seed_matches_derive_seed():
+    """Test uncached row seeds match the general derivation."""
+    sm = SeedManager(master_seed=42)
+    assert sm.row_seed("order", "user_1", 3) == derive_seed(42, "order", "parent", "user_1", "row", 3)
+
+
+def test_derive_seed_parts_are_unambiguous():
+    """Test part boundaries matter and NumPy scalars match Python numbers."""
+    assert derive_seed("ab", "c") != derive_seed("a", "bc")
+    assert derive_seed("1", "user") != derive_seed(1, "user")
+    assert derive_seed(np.int64(7), "user") == derive_seed(7, "user")
+    assert derive_seed(np.float64(0.5), "user") == derive_seed(0.5, "user")
+    assert 0 <= derive_seed(2**80, "user") < 2**32
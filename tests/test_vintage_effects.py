@@ -14,6 +14,7 @@ from datagen.core.vintage_utils import (
     apply_vintage_multipliers_to_values,
     _evaluate_array_curve,
     _evaluate_parametric_curve,
+    _compile_parametric_curve,
 )
 
 
@@ -60,6 +61,17 @@ class TestAgeCalculation:
 
         assert ages[0] == 0  # Can't use entity before it's created
 
+    def test_scalar_reference_counts_whole_local_days(self):
+        """Test a shared reference time floors to whole days in local time."""
+        entity_created = pd.Series(pd.to_datetime(["2024-01-01 12:00", "2024-01-01 22:00", "2024-01-10 23:00", None]))
+        reference_time = pd.Timestamp("2024-01-11 20:00", tz="America/New_York")
+
+        ages = calculate_entity_ages(entity_created, reference_time, "day")
+
+        # 10.3, 9.9 and 0.9 days; converting to UTC first would give 10, 10 and 1
+        assert list(ages[:3]) == [10, 9, 0]
+        assert np.isnan(ages[3])
+
 
 class TestArrayCurveEvaluation:
     """Test array-based curve evaluation."""
@@ -179,6 +191,15 @@ class TestParametricCurveEvaluation:
         assert multipliers[2] == 0.0
         assert multipliers[3] == 0.0
 
+    def test_compiled_curves_are_memoized(self):
+        """Test the evaluator for a given curve spec is built once and reused."""
+        spec = {"curve_type": "logarithmic", "params": {"a": 1.0, "b": -0.15}}
+        _evaluate_parametric_curve(np.array([0, 1]), spec)
+
+        compiled = _compile_parametric_curve("logarithmic", 1.0, -0.15)
+        assert compiled is _compile_parametric_curve("logarithmic", 1.0, -0.15)
+        assert np.allclose(compiled(np.array([0, 1])), [1.0, 1.0 - 0.15 * np.log(2)])
+
     def test_unknown_curve_type_raises_error(self):
         """Test that unknown curve type raises error."""
         ages = np.array([0, 1, 2])
@@ -368,8 +389,8 @@ class TestValueMultipliers:
 
         result = apply_vintage_multipliers_to_values(values, entity_ages, "price", vintage_config)
 
-        # Should be unchanged
-        assert np.array_equal(result, values)
+        # Should be unchanged, and returned without a copy
+        assert result is values
 
     def test_value_multipliers_fanout_ignored(self):
         """Test that fanout multipliers are ignored for values."""
@@ -391,6 +412,24 @@ class TestValueMultipliers:
         # Should be unchanged
         assert np.array_equal(result, values)
 
+    def test_value_multipliers_combined(self):
+        """Test several matching multipliers compose into one product."""
+        values = np.array([100, 100, 100])
+        entity_ages = np.array([0, 1, 2])
+
+        vintage_config = {
+            "age_based_multipliers": {
+                "growth": {"curve": [1.0, 1.5, 2.0], "applies_to": "all"},
+                "discount": {"curve": [1.0, 0.5, 0.5], "applies_to": ["amount"]},
+            }
+        }
+
+        result = apply_vintage_multipliers_to_values(values, entity_ages, "amount", vintage_config)
+
+        assert result.dtype == np.float64
+        assert np.allclose(result, [100, 75, 100])
+        assert np.array_equal(values, [100, 100, 100])
+
     def test_value_multipliers_parametric_curve(self):
         """Test value multipliers with parametric curve."""
         values = np.array([1000.0, 1000.0, 1000.0])